@@ -10,8 +10,8 @@ from dotenv import load_dotenv
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from .config import CONFIG
-from .database.connection import AsyncSessionLocal, init_db
+from .config import CONFIG, get_db_path
+from .database.connection import AsyncSessionLocal, get_engine, init_db
 from .listing_crawler import ListingCrawler
 from .models import Movie as SQLMovie
 from .models import MovieWithPricing, PriceAlert, PriceHistory, Watchlist
@@ -53,7 +53,7 @@ class CDONScraper:
     async def init_database(self) -> None:
         """Initialize database using SQLModel."""
         await init_db()
-        logger.info(f"Database initialized using SQLModel at {CONFIG['db_path']}")
+        logger.info(f"Database initialized using SQLModel at {get_db_path()}")
 
     async def crawl_category(
         self, category_url: str, max_pages: int = 5, scan_mode: str = "fast"
@@ -142,7 +142,7 @@ class CDONScraper:
 
     async def save_single_movie(self, movie: ParsedMovie) -> bool:
         """Save a single movie to database using SQLModel and return success status"""
-        async with AsyncSessionLocal() as session:
+        async with AsyncSessionLocal(bind=get_engine()) as session:
             try:
                 # Try to fetch TMDB data if service is available
                 tmdb_id = None
@@ -260,27 +260,39 @@ class CDONScraper:
         self, session: AsyncSession, movie_id: int, new_price: float
     ) -> None:
         """Check if price has dropped and create alerts using SQLModel"""
-        # Get product_id for this movie
-        movie_result = await session.execute(
-            select(SQLMovie.product_id).where(SQLMovie.id == movie_id)
+        # Fetch product_id, previous price and watchlist target in a single round trip
+        previous_price_sq = (
+            select(PriceHistory.price)
+            .where(PriceHistory.movie_id == movie_id)
+            .order_by(PriceHistory.checked_at.desc())  # type: ignore
+            .offset(1)
+            .limit(1)
+            .scalar_subquery()
+        )
+        target_price_sq = (
+            select(Watchlist.target_price)
+            .where(Watchlist.movie_id == movie_id)
+            .limit(1)
+            .scalar_subquery()
         )
-        product_id = movie_result.scalar_one_or_none()
+        result = await session.execute(
+            select(
+                SQLMovie.product_id,
+                previous_price_sq.label("old_price"),
+                target_price_sq.label("watchlist_target"),
+            ).where(SQLMovie.id == movie_id)
+        )
+        row = result.first()
 
-        if not product_id:
+        if not row or not row.product_id:
             logger.warning(f"No product_id found for movie {movie_id}")
             return
 
-        # Get last two prices
-        result = await session.execute(
-            select(PriceHistory.price)
-            .where(PriceHistory.movie_id == movie_id)
-            .order_by(PriceHistory.checked_at.desc())  # type: ignore
-            .limit(2)
-        )
-        prices = result.scalars().all()
+        product_id = row.product_id
+        old_price = row.old_price
+        watchlist_target = row.watchlist_target
 
-        if len(prices) >= 2:
-            old_price = prices[1]  # Second most recent price
+        if old_price is not None:
             if new_price < old_price:
                 # Price dropped!
                 price_alert = PriceAlert(
@@ -298,11 +310,6 @@ class CDONScraper:
                 )
 
         # Check watchlist targets
-        result = await session.execute(
-            select(Watchlist.target_price).where(Watchlist.movie_id == movie_id)
-        )
-        watchlist_target = result.scalar_one_or_none()
-
         if watchlist_target and new_price <= watchlist_target:
             target_alert = PriceAlert(
                 movie_id=movie_id,
@@ -318,7 +325,7 @@ class CDONScraper:
 
     async def add_to_watchlist(self, product_id: str, target_price: float) -> bool:
         """Add a movie to the watchlist using product_id"""
-        async with AsyncSessionLocal() as session:
+        async with AsyncSessionLocal(bind=get_engine()) as session:
             try:
                 # Find movie by product_id
                 result = await session.execute(
@@ -363,7 +370,7 @@ class CDONScraper:
 
     async def get_price_alerts(self) -> list[dict]:
         """Get unnotified price alerts using SQLModel"""
-        async with AsyncSessionLocal() as session:
+        async with AsyncSessionLocal(bind=get_engine()) as session:
             query = (
                 select(PriceAlert, SQLMovie.title, SQLMovie.url)
                 .join(SQLMovie)
@@ -392,7 +399,7 @@ class CDONScraper:
 
     async def mark_alerts_notified(self, alert_ids: list[int]) -> None:
         """Mark alerts as notified using SQLModel"""
-        async with AsyncSessionLocal() as session:
+        async with AsyncSessionLocal(bind=get_engine()) as session:
             try:
                 for alert_id in alert_ids:
                     result = await session.execute(
@@ -421,7 +428,7 @@ class CDONScraper:
         """
         from datetime import timedelta
 
-        async with AsyncSessionLocal() as session:
+        async with AsyncSessionLocal(bind=get_engine()) as session:
             try:
                 cutoff_date = datetime.now(UTC) - timedelta(days=days_threshold)
 
@@ -451,7 +458,7 @@ class CDONScraper:
 
     async def search_movies(self, query: str) -> list[MovieWithPricing]:
         """Search for movies in the database using SQLModel"""
-        async with AsyncSessionLocal() as session:
+        async with AsyncSessionLocal(bind=get_engine()) as session:
             from .database.repository import DatabaseRepository
 
             repo = DatabaseRepository(session)
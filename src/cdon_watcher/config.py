@@ -3,6 +3,13 @@
 import os
 from typing import Any
 
+DEFAULT_DB_PATH = "./data/cdon_movies.db"
+
+
+def get_db_path() -> str:
+    """Return the database path, read from DB_PATH at call time."""
+    return os.environ.get("DB_PATH", DEFAULT_DB_PATH)
+
 
 def load_config() -> dict[str, Any]:
     """Load configuration from environment variables."""
@@ -12,7 +19,6 @@ def load_config() -> dict[str, Any]:
         "api_host": os.environ.get("API_HOST", "0.0.0.0"),
         "api_port": int(os.environ.get("API_PORT", 8080)),
         "api_debug": os.environ.get("API_DEBUG", "false").lower() == "true",
-        "db_path": os.environ.get("DB_PATH", "./data/cdon_movies.db"),
         "tmdb_api_key": os.environ.get("TMDB_API_KEY", ""),
         "poster_dir": os.environ.get("POSTER_DIR", "./data/posters"),
         # Scan mode configurations
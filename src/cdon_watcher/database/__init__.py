@@ -1,7 +1,7 @@
 """Database package for CDON Watcher."""
 
 # Modern async database components
-from .connection import get_db_session, init_db
+from .connection import create_schema, get_db_session, get_engine, init_db
 from .repository import DatabaseRepository
 
-__all__ = ["DatabaseRepository", "get_db_session", "init_db"]
+__all__ = ["DatabaseRepository", "create_schema", "get_db_session", "get_engine", "init_db"]
@@ -1,41 +1,82 @@
 """Database connection and initialization for SQLModel."""
 
+import functools
 from collections.abc import AsyncGenerator
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlmodel import SQLModel
 
-from ..config import CONFIG
-
-# Create async engine
-engine = create_async_engine(
-    f"sqlite+aiosqlite:///{CONFIG['db_path']}",
-    echo=False,  # Set to True for SQL debugging
-    future=True,
-)
+from ..config import get_db_path
 
-# Create session factory
+# Create session factory; sessions are bound to get_engine() when opened
 AsyncSessionLocal = async_sessionmaker(
-    engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
 
 
+def _unicode_lower(value: Any) -> Any:
+    """Lower-case text with Python's Unicode rules, passing NULLs and non-text through."""
+    return value.lower() if isinstance(value, str) else value
+
+
+def register_sqlite_functions(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Register unicode_lower() on a new connection.
+
+    SQLite's built-in lower() and LIKE only fold ASCII; title search calls unicode_lower()
+    so Finnish letters such as ä and ö match regardless of case. lower() is left untouched.
+    """
+    dbapi_connection.create_function("unicode_lower", 1, _unicode_lower, deterministic=True)
+
+
+@functools.cache
+def _engine_for(db_path: str) -> AsyncEngine:
+    """Create the async engine for a database path, once per path."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}",
+        echo=False,  # Set to True for SQL debugging
+        future=True,
+    )
+    event.listen(engine.sync_engine, "connect", register_sqlite_functions)
+    return engine
+
+
+def get_engine() -> AsyncEngine:
+    """Return the engine for the current database path, creating it on first use."""
+    return _engine_for(get_db_path())
+
+
 async def init_db() -> None:
     """Initialize database tables."""
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
     # Run migrations for existing databases
     await _run_migrations()
 
 
+async def create_schema(db_path: str) -> None:
+    """Create database tables at db_path without touching the global engine."""
+    schema_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", future=True)
+    try:
+        async with schema_engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+    finally:
+        await schema_engine.dispose()
+
+
 async def _run_migrations() -> None:
     """Run database migrations for schema changes."""
     from sqlalchemy import text
 
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         # Migration: Add 'available' column if it doesn't exist
         # SQLite will error if column already exists, which we can safely ignore
         try:
@@ -48,7 +89,7 @@ async def _run_migrations() -> None:
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Get database session for dependency injection."""
-    async with AsyncSessionLocal() as session:
+    async with AsyncSessionLocal(bind=get_engine()) as session:
         try:
             yield session
         finally:
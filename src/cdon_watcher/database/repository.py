@@ -172,8 +172,8 @@ class DatabaseRepository:
 
         return [DealMovie.model_validate(dict(row._mapping)) for row in result.all()]
 
-    async def get_watchlist(self) -> list[WatchlistMovie]:
-        """Get all watchlist items."""
+    def _watchlist_query(self) -> Any:
+        """Build the base watchlist query joined with movie pricing."""
         current_price_sq = self._current_price_subquery()
         lowest_price_sq = self._lowest_price_subquery()
         highest_price_sq = self._highest_price_subquery()
@@ -196,11 +196,27 @@ class DatabaseRepository:
             highest_price_sq.label("highest_price"),
         ).join(Movie, Watchlist.movie_id == Movie.id)
 
+        return query
+
+    async def get_watchlist(self) -> list[WatchlistMovie]:
+        """Get all watchlist items."""
+        query = self._watchlist_query()
+
         self._log_query("get_watchlist", query)
         result = await self.session.execute(query)
 
         return [WatchlistMovie.model_validate(dict(row._mapping)) for row in result.all()]
 
+    async def get_watchlist_item(self, product_id: str) -> WatchlistMovie | None:
+        """Get a single watchlist item by product_id."""
+        query = self._watchlist_query().where(Watchlist.product_id == product_id).limit(1)
+
+        self._log_query("get_watchlist_item", query)
+        result = await self.session.execute(query)
+        row = result.first()
+
+        return WatchlistMovie.model_validate(dict(row._mapping)) if row else None
+
     async def add_to_watchlist(self, product_id: str, target_price: float) -> bool:
         """Add a movie to watchlist by product_id."""
         async with self._handle_transaction(f"add_to_watchlist({product_id})"):
@@ -278,7 +294,8 @@ class DatabaseRepository:
 
         # Add title search only if query is provided
         if query and query.strip():
-            conditions.append(Movie.title.ilike(f"%{query}%"))  # type: ignore[attr-defined]
+            # Only the title column goes through the Python callback; the query is folded here
+            conditions.append(func.unicode_lower(Movie.title).like(f"%{query.lower()}%"))
 
         # Add price filtering
         if max_price is not None:
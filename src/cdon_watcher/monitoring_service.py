@@ -7,7 +7,7 @@ from datetime import datetime as dt
 
 from sqlmodel import select
 
-from .database.connection import AsyncSessionLocal
+from .database.connection import AsyncSessionLocal, get_engine
 from .models import Movie as SQLMovie
 from .models import PriceHistory, Watchlist
 from .notifications import NotificationService
@@ -24,7 +24,7 @@ class PriceMonitor:
 
     async def check_watchlist_prices(self) -> None:
         """Check prices for all watchlist items using SQLModel."""
-        async with AsyncSessionLocal() as session:
+        async with AsyncSessionLocal(bind=get_engine()) as session:
             # Get all watchlist items with their URLs
             query = select(Watchlist, SQLMovie.url, SQLMovie.title).join(
                 SQLMovie,
@@ -63,7 +63,7 @@ class PriceMonitor:
 
     async def _save_single_movie(self, movie: ParsedMovie) -> bool:
         """Save a single movie to database using SQLModel (simplified version)"""
-        async with AsyncSessionLocal() as session:
+        async with AsyncSessionLocal(bind=get_engine()) as session:
             try:
                 # Generate a unique product_id if None
                 product_id = movie.product_id
@@ -2,19 +2,193 @@
 Product parser for individual CDON product pages using pure Python (no Playwright)
 """
 
+import functools
+import json
 import logging
 import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
+from typing import Any
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Comment, NavigableString, PageElement, SoupStrainer, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Product details sit well within the first few hundred KB of a page
+_MAX_PAGE_BYTES = 512 * 1024
+
+# Opt-in page cache (see ProductParser's cache_ttl): fresh pages are reused, stale ones
+# revalidated with ETag/Last-Modified; total cached HTML is capped by size, not page count
+_PAGE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Only build the tree for tags the extractors inspect; top-level <script>/<style>/<meta>
+# (including the large framework data blobs) are tokenized but never turned into nodes
+_PAGE_STRAINER = SoupStrainer(["title", "main", "div", "section", "h1", "h2", "p", "span", "img"])
+
+# Patterns used on every parsed page, compiled once at import
+_LD_JSON_RX = re.compile(
+    rb"<script[^>]+application/ld\+json[^>]*>(.*?)</script>", re.IGNORECASE | re.DOTALL
+)
+_PRODUCT_ID_RX = re.compile(r"/tuote/[^/]+-([a-f0-9]+)/?$")
+_HEX_ID_RX = re.compile(r"([a-f0-9]{8,})/?$")
+_YEAR_RX = re.compile(r"(?<!\d)(\d{4})(?!\d)")
+_PRICE_TEXT_RX = re.compile(r"\d+[,.]?\d*\s*€")
+_PRICE_NUMBER_RX = re.compile(r"(\d+\.?\d*)")
+_YEAR_LABEL_RX = re.compile(r"Nauhoitusvuosi", re.IGNORECASE)
+_SHIPPING_RX = re.compile(r"toimitus|shipping", re.IGNORECASE)
+# Interned format labels so every parsed Movie shares the same three string objects
+_FORMAT_4K_BLURAY = sys.intern("4K Blu-ray")
+_FORMAT_BLURAY = sys.intern("Blu-ray")
+_FORMAT_DVD = sys.intern("DVD")
+
+# Single-pass price cleanup: drop € and (non-breaking) spaces, comma decimals become dots
+_PRICE_TRANS = str.maketrans({"€": None, " ": None, "\xa0": None, ",": "."})
+
+# "Nauhoitusvuosi" label followed closely by a year in the supported 1900-2030 range
+_LABELLED_YEAR_RX = re.compile(
+    r"nauhoitusvuosi[^0-9]{0,10}(19[0-9]{2}|20[0-2][0-9]|2030)(?![0-9])", re.IGNORECASE
+)
+# Nodes walked after a year label looking for its value; covers a separator span, whitespace
+# and the value element itself
+_LABEL_VALUE_LOOKAHEAD = 12
+_DIGIT_RX = re.compile(r"[0-9]")
+# Production year as commonly printed in CDON titles, e.g. "Batman (1989) (Blu-ray)"
+_TITLE_YEAR_RX = re.compile(r"\((19[0-9]{2}|20[0-2][0-9]|2030)\)")
+# Same as _LABELLED_YEAR_RX, over raw response bytes: the label may be separated from the year by tags, as long
+# as no other digits (e.g. in hashed class names) come in between
+_RAW_LABELLED_YEAR_RX = re.compile(
+    rb"nauhoitusvuosi[^0-9]{0,200}?(19[0-9]{2}|20[0-2][0-9]|2030)(?![0-9])", re.IGNORECASE
+)
+
+
+# Pure string helpers shared by every ProductParser instance. Titles and URLs repeat across
+# listing scans, so results are memoized; maxsize bounds the caches for long-running watchers.
+@functools.lru_cache(maxsize=4096)
+def _is_valid_title(title: str) -> bool:
+    """Check if a title candidate is valid (not promotional text)"""
+    if not title or len(title) < 10:
+        return False
+
+    # Filter out promotional text and other non-title content
+    lowered = title.lower()
+    if "vihdoin arki" in lowered or "myyty tänään" in lowered or "€" in title or "osta" in lowered:
+        return False
+
+    if title.endswith("%"):
+        return False
+
+    # Filter out pure numbers
+    if title.replace(".", "").replace(",", "").replace(" ", "").isdigit():
+        return False
+
+    return True
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_product_id(url: str) -> str | None:
+    """Extract product ID from URL"""
+    # CDON URLs typically end with product ID
+    # e.g., /tuote/movie-title-abc123def456/
+    match = _PRODUCT_ID_RX.search(url)
+    if match:
+        return match.group(1)
+
+    # Fallback: try to extract any ID-like string from URL
+    match = _HEX_ID_RX.search(url.rstrip("/"))
+    if match:
+        return match.group(1)
+
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_valid_year(text: str) -> int | None:
+    """Extract and validate a 4-digit year from text"""
+    # Fast path for bare numbers such as the "1989" value cell next to the label
+    if text.isdecimal():
+        year = int(text)
+    else:
+        year_match = _YEAR_RX.search(text)
+        if not year_match:
+            return None
+        year = int(year_match.group(1))
+
+    if 1900 <= year <= 2030:  # Reasonable range for movies
+        return year
+
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _determine_format(title: str) -> str:
+    """Determine if movie is Blu-ray or 4K Blu-ray"""
+    lowered = title.lower()
+    if "4k" in lowered or "uhd" in lowered or "ultra hd" in lowered:
+        return _FORMAT_4K_BLURAY
+    elif "blu-ray" in lowered or "bluray" in lowered or "bd" in lowered:
+        return _FORMAT_BLURAY
+    return _FORMAT_DVD  # Default fallback
+
+
+def _select(soup: BeautifulSoup, selector: str) -> list[Any]:
+    """soup.select() that skips the CSS selector engine for bare tag names like h1/h2"""
+    if selector.isalnum():
+        return soup.find_all(selector)
+    return soup.select(selector)
+
+
+def _node_text(node: Any) -> str:
+    """get_text(strip=True) that reads a lone text child directly instead of walking the node"""
+    text = node.string
+    if text is not None:
+        return str(text.strip())
+    return str(node.get_text(strip=True))
+
+
+def _json_ld_product(content: bytes) -> dict[str, Any] | None:
+    """Return the first schema.org Product object embedded as JSON-LD, if any"""
+    for match in _LD_JSON_RX.finditer(content):
+        try:
+            data = json.loads(match.group(1))
+        except ValueError:
+            continue
+
+        candidates = data if isinstance(data, list) else [data]
+        if isinstance(data, dict) and isinstance(data.get("@graph"), list):
+            candidates = data["@graph"]
+
+        for candidate in candidates:
+            if isinstance(candidate, dict) and candidate.get("@type") == "Product":
+                return candidate
+
+    return None
 
-@dataclass
+
+def _json_ld_price(product: dict[str, Any]) -> float | None:
+    """Read the offer price from a JSON-LD Product, accepting one offer or a list"""
+    offers = product.get("offers")
+    if isinstance(offers, list):
+        offers = offers[0] if offers else None
+    if not isinstance(offers, dict):
+        return None
+
+    try:
+        return float(offers["price"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True)
 class Movie:
     """Data class for movie information"""
 
@@ -28,11 +202,43 @@ class Movie:
     production_year: int | None = None
 
 
+@dataclass(slots=True)
+class _CachedPage:
+    """Raw HTML of a fetched product page plus its validators"""
+
+    content: bytes
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+
 class ProductParser:
     """Parser for individual CDON product pages using HTTP requests + BeautifulSoup"""
 
-    def __init__(self) -> None:
+    __slots__ = ("cache_ttl", "_page_cache", "_page_cache_bytes", "_page_cache_lock", "session")
+
+    def __init__(self, cache_ttl: float | None = None) -> None:
+        # Seconds a fetched page is reused before revalidation; None disables the page cache
+        # so price checks always see the live page
+        self.cache_ttl = cache_ttl
+        self._page_cache: OrderedDict[str, _CachedPage] = OrderedDict()
+        self._page_cache_bytes = 0
+        self._page_cache_lock = threading.Lock()
         self.session = requests.Session()
+        # Keep pooled keep-alive connections to cdon.fi and retry transient server errors;
+        # connection failures are not retried so unreachable hosts still fail fast
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                connect=0,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
         # Set up realistic headers to avoid blocking
         self.session.headers.update(
             {
@@ -49,18 +255,24 @@ class ProductParser:
         """Parse a single product page and extract movie information"""
         try:
             logger.info(f"Fetching product page: {url}")
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            content = self._fetch_html(url)
+            if content is None:
+                return None
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(content, "lxml", parse_only=_PAGE_STRAINER)
 
-            # Extract components
-            title = self._extract_title(soup)
+            # Prefer structured JSON-LD product data, falling back to scraping the markup
+            product_data = _json_ld_product(content) or {}
+            title = product_data.get("name")
+            if not (isinstance(title, str) and self._is_valid_title(title)):
+                title = self._extract_title(soup)
             if not title:
                 logger.warning(f"No title found for {url}")
                 return None
 
-            price = self._extract_price(soup)
+            price = _json_ld_price(product_data)
+            if price is None or price <= 0:
+                price = self._extract_price(soup)
             if price is None:
                 logger.warning(f"No price found for {url}")
                 return None
@@ -69,7 +281,13 @@ class ProductParser:
             availability = self._extract_availability(soup)
             image_url = self._extract_image_url(soup)
             product_id = self._extract_product_id(url)
-            production_year = self._extract_production_year(soup)
+            # Fast paths first: a "(1989)" year in the title, then the label and year being
+            # adjacent in the raw markup; the DOM methods only run when both miss
+            production_year = (
+                self._extract_year_from_title(title)
+                or self._extract_production_year_from_html(content)
+                or self._extract_production_year(soup)
+            )
 
             return Movie(
                 title=title,
@@ -89,6 +307,83 @@ class ProductParser:
             logger.error(f"Error parsing {url}: {e}")
             return None
 
+    def _fetch_html(self, url: str) -> bytes | None:
+        """Fetch a page's HTML, reusing a fresh cached copy or revalidating a stale one"""
+        cached = None
+        if self.cache_ttl is not None:
+            with self._page_cache_lock:
+                cached = self._page_cache.get(url)
+                if cached:
+                    self._page_cache.move_to_end(url)
+            if cached and time.monotonic() - cached.fetched_at < self.cache_ttl:
+                logger.debug(f"Using cached page for {url}")
+                return cached.content
+
+        conditional_headers = {}
+        if cached and cached.etag:
+            conditional_headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            conditional_headers["If-Modified-Since"] = cached.last_modified
+
+        # Stream so non-HTML bodies are never downloaded and oversized pages are capped
+        response = self.session.get(url, timeout=10, stream=True, headers=conditional_headers)
+        try:
+            if cached and response.status_code == 304:
+                cached.fetched_at = time.monotonic()
+                return cached.content
+
+            response.raise_for_status()
+            content = self._read_html(response, url)
+            if content is not None and self.cache_ttl is not None:
+                self._cache_page(url, content, response.headers)
+            return content
+        finally:
+            response.close()
+
+    def _cache_page(self, url: str, content: bytes, headers: Any) -> None:
+        """Store a fetched page, evicting least recently used pages past the size cap"""
+        page = _CachedPage(
+            content=content,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            fetched_at=time.monotonic(),
+        )
+        with self._page_cache_lock:
+            previous = self._page_cache.pop(url, None)
+            if previous:
+                self._page_cache_bytes -= len(previous.content)
+            self._page_cache[url] = page
+            self._page_cache_bytes += len(content)
+            while self._page_cache_bytes > _PAGE_CACHE_MAX_BYTES and len(self._page_cache) > 1:
+                _, evicted = self._page_cache.popitem(last=False)
+                self._page_cache_bytes -= len(evicted.content)
+
+    def clear_page_cache(self) -> None:
+        """Drop every cached page"""
+        with self._page_cache_lock:
+            self._page_cache.clear()
+            self._page_cache_bytes = 0
+
+    def _read_html(self, response: requests.Response, url: str) -> bytes | None:
+        """Read at most _MAX_PAGE_BYTES of an HTML response body, None for other content"""
+        content_type = response.headers.get("Content-Type", "")
+        if content_type and "html" not in content_type:
+            logger.warning(f"Skipping non-HTML response ({content_type}) for {url}")
+            return None
+
+        # Read one byte past the cap so a truncated page can be told apart from one that fits
+        content = bytes(response.raw.read(_MAX_PAGE_BYTES + 1, decode_content=True))
+        if len(content) > _MAX_PAGE_BYTES:
+            logger.warning(f"Page larger than {_MAX_PAGE_BYTES} bytes, truncating: {url}")
+            content = content[:_MAX_PAGE_BYTES]
+        return content
+
+    def parse_many(self, urls: list[str], max_workers: int = 8) -> list[Movie | None]:
+        """Parse several product pages concurrently, returning results in input order"""
+        # Fetching is I/O bound, so threads sharing the pooled session overlap the waits
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.parse_product_page, urls))
+
     def _extract_title(self, soup: BeautifulSoup) -> str | None:
         """Extract movie title with anti-promotional filtering"""
         # Try different title selectors in order of preference
@@ -101,9 +396,9 @@ class ProductParser:
         ]
 
         for selector in title_selectors:
-            elements = soup.select(selector)
+            elements = _select(soup, selector)
             for element in elements:
-                candidate = element.get_text(strip=True)
+                candidate = _node_text(element)
 
                 # Apply the same filtering logic from the original scraper
                 if self._is_valid_title(candidate):
@@ -113,7 +408,7 @@ class ProductParser:
         # Fallback: try to extract from page title
         page_title = soup.find("title")
         if page_title:
-            title_text = page_title.get_text(strip=True)
+            title_text = _node_text(page_title)
             # Remove " | CDON" suffix if present
             if " | " in title_text:
                 candidate = title_text.split(" | ")[0].strip()
@@ -125,23 +420,7 @@ class ProductParser:
 
     def _is_valid_title(self, title: str) -> bool:
         """Check if a title candidate is valid (not promotional text)"""
-        if not title or len(title) < 10:
-            return False
-
-        # Filter out promotional text and other non-title content
-        promotional_terms = ["vihdoin arki", "myyty tänään", "€", "osta"]
-
-        if any(promo in title.lower() for promo in promotional_terms):
-            return False
-
-        if title.endswith("%"):
-            return False
-
-        # Filter out pure numbers
-        if title.replace(".", "").replace(",", "").replace(" ", "").isdigit():
-            return False
-
-        return True
+        return _is_valid_title(title)
 
     def _extract_price(self, soup: BeautifulSoup) -> float | None:
         """Extract current price from the page"""
@@ -156,25 +435,25 @@ class ProductParser:
 
         # Try priority selectors first
         for selector in priority_selectors:
-            elements = soup.select(selector)
+            elements = _select(soup, selector)
             for element in elements:
-                text = element.get_text(strip=True)
+                text = _node_text(element)
                 if "€" in text:
                     price = self._extract_price_from_text(text)
                     if price is not None and price > 5.0:  # Reasonable movie price
                         # Skip obvious non-product prices
-                        if "toimitus" not in text.lower() and "shipping" not in text.lower():
+                        if not _SHIPPING_RX.search(text):
                             logger.debug(f"Found price with selector '{selector}': €{price}")
                             return price
 
         # Fallback: look for any element containing € but filter better
-        all_elements = soup.find_all(string=re.compile(r"\d+[,.]?\d*\s*€"))
+        all_elements = soup.find_all(string=_PRICE_TEXT_RX)
 
         for element in all_elements:
             if element.parent:
-                price_text = element.strip()
+                price_text = str(element).strip()
                 # Skip shipping/delivery messages
-                if "toimitus" in price_text.lower() or "shipping" in price_text.lower():
+                if _SHIPPING_RX.search(price_text):
                     continue
 
                 price = self._extract_price_from_text(price_text)
@@ -187,14 +466,10 @@ class ProductParser:
     def _extract_price_from_text(self, price_text: str) -> float | None:
         """Extract numeric price from text (reuse existing logic)"""
         try:
-            # Remove currency symbols and spaces
-            price_text = (
-                price_text.replace("€", "").replace("EUR", "").replace(" ", "").replace("\xa0", "")
-            )
-            # Handle Finnish decimal separator
-            price_text = price_text.replace(",", ".")
+            # Remove currency symbols and spaces and handle the Finnish decimal separator
+            price_text = price_text.replace("EUR", "").translate(_PRICE_TRANS)
             # Extract first number
-            match = re.search(r"(\d+\.?\d*)", price_text)
+            match = _PRICE_NUMBER_RX.search(price_text)
             if match:
                 return float(match.group(1))
         except (ValueError, AttributeError):
@@ -213,7 +488,7 @@ class ProductParser:
         for selector in availability_selectors:
             element = soup.select_one(selector)
             if element:
-                availability = element.get_text(strip=True)
+                availability = _node_text(element)
                 if availability:
                     return str(availability)
 
@@ -243,31 +518,40 @@ class ProductParser:
 
     def _extract_product_id(self, url: str) -> str | None:
         """Extract product ID from URL"""
-        # CDON URLs typically end with product ID
-        # e.g., /tuote/movie-title-abc123def456/
-        match = re.search(r"/tuote/[^/]+-([a-f0-9]+)/?$", url)
-        if match:
-            return match.group(1)
+        return _extract_product_id(url)
 
-        # Fallback: try to extract any ID-like string from URL
-        match = re.search(r"([a-f0-9]{8,})/?$", url.rstrip("/"))
-        if match:
-            return match.group(1)
+    def _extract_year_from_title(self, title: str) -> int | None:
+        """Extract a parenthesized production year such as "Batman (1989)" from the title"""
+        match = _TITLE_YEAR_RX.search(title)
+        return int(match.group(1)) if match else None
 
-        return None
+    def _extract_production_year_from_html(self, content: bytes) -> int | None:
+        """Extract production year straight from the raw page bytes, without the DOM"""
+        match = _RAW_LABELLED_YEAR_RX.search(content)
+        if not match:
+            return None
+
+        year = int(match.group(1))
+        logger.debug(f"Found production year in raw HTML: {year}")
+        return year
 
     def _extract_production_year(self, soup: BeautifulSoup) -> int | None:
         """Extract production year from the product details section"""
         try:
+            # Collect every "Nauhoitusvuosi" label in one pass; both methods start from them
+            labels = soup.find_all(string=_YEAR_LABEL_RX)
+
             # Method 1: Find next sibling of "Nauhoitusvuosi" label
-            year = self._extract_year_from_sibling(soup)
-            if year:
-                return year
+            for label in labels:
+                year = self._year_from_label_sibling(label)
+                if year:
+                    return year
 
-            # Method 2: Look for year in container with "Nauhoitusvuosi"
-            year = self._extract_year_from_container(soup)
-            if year:
-                return year
+            # Method 2: Look for a year right after the label text
+            for label in labels:
+                year = self._year_from_label_text(label)
+                if year:
+                    return year
 
             logger.debug("No production year found")
             return None
@@ -276,54 +560,49 @@ class ProductParser:
             logger.debug(f"Error extracting production year: {e}")
             return None
 
-    def _extract_year_from_sibling(self, soup: BeautifulSoup) -> int | None:
-        """Extract year from sibling element of Nauhoitusvuosi label"""
-        nauhoitusvuosi_element = soup.find(string=re.compile(r"Nauhoitusvuosi", re.IGNORECASE))
-        if not nauhoitusvuosi_element:
-            return None
-
-        label_p = nauhoitusvuosi_element.parent
-        if not (label_p and label_p.name == "p"):
+    def _year_from_label_sibling(self, label: PageElement) -> int | None:
+        """Extract year from the <p> following the label's own <p>"""
+        label_p = label.parent
+        if not (isinstance(label_p, Tag) and label_p.name == "p"):
             return None
 
         next_sibling = label_p.find_next_sibling()
-        if not (next_sibling and next_sibling.name == "p"):
+        if not (isinstance(next_sibling, Tag) and next_sibling.name == "p"):
             return None
 
-        return self._extract_valid_year(next_sibling.get_text(strip=True))
+        return self._extract_valid_year(_node_text(next_sibling))
+
+    def _year_from_label_text(self, label: PageElement) -> int | None:
+        """Extract a year printed after the label, in its own or the following text nodes"""
+        # Walk forward over separator and whitespace nodes (e.g. a ":" span) up to the first
+        # text holding digits, so markup between the label and its value doesn't hide the year
+        parts = [label.get_text().strip()]
+        for element in islice(label.next_elements, _LABEL_VALUE_LOOKAHEAD):
+            if not isinstance(element, NavigableString) or isinstance(element, Comment):
+                continue
+            text = element.strip()
+            if text:
+                parts.append(text)
+                if _DIGIT_RX.search(text):
+                    break
+        match = _LABELLED_YEAR_RX.search(" ".join(parts))
+        if not match:
+            return None
 
-    def _extract_year_from_container(self, soup: BeautifulSoup) -> int | None:
-        """Extract year from any div containing Nauhoitusvuosi"""
-        divs = soup.find_all("div")
-        for div in divs:
-            text = div.get_text()
-            if "nauhoitusvuosi" in text.lower():
-                year = self._extract_valid_year(text)
-                if year:
-                    return year
-        return None
+        year = int(match.group(1))
+        logger.debug(f"Found production year: {year}")
+        return year
 
     def _extract_valid_year(self, text: str) -> int | None:
         """Extract and validate a 4-digit year from text"""
-        year_match = re.search(r"(\d{4})", text)
-        if not year_match:
-            return None
-
-        year = int(year_match.group(1))
-        if 1900 <= year <= 2030:  # Reasonable range for movies
+        year = _extract_valid_year(text)
+        if year is not None:
             logger.debug(f"Found production year: {year}")
-            return year
-
-        return None
+        return year
 
     def _determine_format(self, title: str) -> str:
         """Determine if movie is Blu-ray or 4K Blu-ray (reuse existing logic)"""
-        title_lower = title.lower()
-        if "4k" in title_lower or "uhd" in title_lower or "ultra hd" in title_lower:
-            return "4K Blu-ray"
-        elif "blu-ray" in title_lower or "bluray" in title_lower or "bd" in title_lower:
-            return "Blu-ray"
-        return "DVD"  # Default fallback
+        return _determine_format(title)
 
     def is_bluray_format(self, title: str, format: str) -> bool:
         """Check if the item is a Blu-ray or 4K Blu-ray (reuse existing logic)"""
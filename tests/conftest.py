@@ -1,13 +1,20 @@
 """Shared pytest fixtures for CDON Watcher tests."""
 
 import asyncio
-import tempfile
-from collections.abc import Generator
+import sqlite3
+import uuid
+from collections.abc import Callable, Generator
 from pathlib import Path
+from typing import Any
 
 import pytest
+from sqlalchemy import Engine, Index, create_engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel
 
 from src.cdon_watcher.cdon_scraper import CDONScraper
+from src.cdon_watcher.database.connection import create_schema, register_sqlite_functions
 from src.cdon_watcher.listing_crawler import ListingCrawler
 from src.cdon_watcher.product_parser import ProductParser
 
@@ -20,28 +27,177 @@ def event_loop():
     loop.close()
 
 
-@pytest.fixture
-def temp_db_path() -> Generator[str, None, None]:
-    """Provide a temporary database path for tests."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp_file:
-        temp_path = tmp_file.name
+# Throwaway test databases don't need durability, so skip the per-commit fsyncs
+_FAST_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+
+def _sqlite_url(database: str, driver: str = "aiosqlite") -> str:
+    """Build an SQLAlchemy URL for a SQLite file path or URI filename."""
+    url = f"sqlite+{driver}:///{database}"
+    if database.startswith("file:"):
+        # SQLite URI filenames (e.g. shared-cache memory databases) need uri=true
+        url += "&uri=true" if "?" in database else "?uri=true"
+    return url
+
+
+def _apply_fast_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Apply the fast-test PRAGMAs to a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _FAST_SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def _use_explicit_sqlite_transactions(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Turn off the sqlite3 driver's implicit BEGIN so SQLAlchemy emits its own."""
+    dbapi_connection.isolation_level = None
+
+
+def _emit_sqlite_begin(conn: Any) -> None:
+    """Start the transaction explicitly so SAVEPOINTs nest inside it."""
+    conn.exec_driver_sql("BEGIN")
+
+
+def _secondary_indexes() -> list[Index]:
+    """Return the non-unique indexes; unique ones stay to enforce constraints."""
+    return [
+        index
+        for table in SQLModel.metadata.sorted_tables
+        for index in table.indexes
+        if not index.unique
+    ]
+
+
+def _drop_secondary_indexes(engine: Engine) -> None:
+    """Drop secondary indexes ahead of a bulk seed."""
+    with engine.begin() as conn:
+        for index in _secondary_indexes():
+            index.drop(conn)
+
+
+def _create_secondary_indexes(engine: Engine) -> None:
+    """Recreate the secondary indexes dropped by _drop_secondary_indexes."""
+    with engine.begin() as conn:
+        for index in _secondary_indexes():
+            index.create(conn)
+
+
+@pytest.fixture(scope="session")
+def sqlite_engine_factory() -> Callable[[str], AsyncEngine]:
+    """Provide a factory for async SQLite engines tuned for test databases.
+
+    Engines use a StaticPool so every session in a test reuses one connection
+    instead of opening (and re-reading the schema for) a new one per checkout.
+    Transactions are begun explicitly so sessions can be joined to an outer
+    transaction with SAVEPOINTs and rolled back after each test.
+    """
+
+    def _create_engine(database: str) -> AsyncEngine:
+        engine = create_async_engine(
+            _sqlite_url(database), echo=False, future=True, poolclass=StaticPool
+        )
+        event.listen(engine.sync_engine, "connect", _use_explicit_sqlite_transactions)
+        event.listen(engine.sync_engine, "connect", _apply_fast_sqlite_pragmas)
+        event.listen(engine.sync_engine, "connect", register_sqlite_functions)
+        event.listen(engine.sync_engine, "begin", _emit_sqlite_begin)
+        return engine
+
+    return _create_engine
+
+
+@pytest.fixture(scope="module")
+def memory_db_uri() -> Generator[str, None, None]:
+    """Provide a private in-memory SQLite database as a shared-cache URI.
+
+    A keepalive connection is held for the duration of the module, otherwise SQLite
+    drops the memory database as soon as the last engine connection closes.
+    """
+    db_uri = f"file:test_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    keepalive = sqlite3.connect(db_uri, uri=True)
 
-    yield temp_path
+    yield db_uri
 
-    # Clean up
-    temp_file_path = Path(temp_path)
-    if temp_file_path.exists():
-        temp_file_path.unlink()
+    keepalive.close()
+
+
+@pytest.fixture(scope="session")
+def sqlite_template_factory() -> Generator[
+    Callable[[Callable[[Session], None]], sqlite3.Connection], None, None
+]:
+    """Provide a factory that builds seeded template databases once per session.
+
+    Each template is an in-memory database with the full schema plus whatever the
+    seed function inserts. Tests restore it into their own database with
+    ``template.backup(target)``, which is a raw page copy instead of re-running the
+    DDL and seed INSERTs for every test.
+    """
+    templates: list[sqlite3.Connection] = []
+
+    def _build_template(seed: Callable[[Session], None]) -> sqlite3.Connection:
+        db_uri = f"file:template_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        template = sqlite3.connect(db_uri, uri=True)
+        templates.append(template)
+
+        engine = create_engine(_sqlite_url(db_uri, driver="pysqlite"))
+        SQLModel.metadata.create_all(engine)
+
+        # Build secondary indexes once after the bulk seed instead of per row
+        _drop_secondary_indexes(engine)
+        with Session(engine) as session:
+            seed(session)
+        _create_secondary_indexes(engine)
+        engine.dispose()
+
+        return template
+
+    yield _build_template
+
+    for template in templates:
+        template.close()
+
+
+@pytest.fixture(scope="session")
+def schema_template_db(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Create the database schema once per session in a template file.
+
+    Tests that need an empty schema copy this file into place with
+    ``shutil.copyfile`` instead of running every CREATE TABLE/INDEX again.
+    """
+    template_path = str(tmp_path_factory.mktemp("schema") / "template.db")
+    asyncio.run(create_schema(template_path))
+    return template_path
 
 
 @pytest.fixture
-def product_parser() -> Generator[ProductParser, None, None]:
-    """Provide a ProductParser instance for tests."""
+def temp_db_path(tmp_path: Path) -> str:
+    """Provide a temporary database path for tests; pytest removes tmp_path itself."""
+    return str(tmp_path / "test.db")
+
+
+@pytest.fixture(scope="session")
+def shared_product_parser() -> Generator[ProductParser, None, None]:
+    """Provide one ProductParser, and so one HTTP connection pool, for the whole session."""
     parser = ProductParser()
     yield parser
     parser.close()
 
 
+@pytest.fixture
+def product_parser(shared_product_parser: ProductParser) -> ProductParser:
+    """Provide the shared ProductParser with an empty page cache.
+
+    Mocked tests patch ``requests.Session.get`` on the class, so they work against the
+    shared instance; clearing the cache keeps one test's pages from answering another's.
+    """
+    shared_product_parser.clear_page_cache()
+    return shared_product_parser
+
+
 @pytest.fixture
 def listing_crawler() -> Generator[ListingCrawler, None, None]:
     """Provide a ListingCrawler instance for tests."""
@@ -58,16 +214,6 @@ def cdon_scraper(temp_db_path: str) -> Generator[CDONScraper, None, None]:
     scraper.close()
 
 
-@pytest.fixture
-def sample_product_urls() -> list[str]:
-    """Provide sample product URLs for testing."""
-    return [
-        "https://cdon.fi/tuote/breaking-bad-complete-box-kausi-1-5-blu-ray-e91bc5deded24435/",
-        "https://cdon.fi/tuote/house-of-the-dragon-kausi-2-blu-ray-06077e495a0a59db/",
-        "https://cdon.fi/tuote/indiana-jones-4-movie-collection-blu-ray-5-disc-e5a58c8cee5e590e/",
-    ]
-
-
 @pytest.fixture
 def sample_category_url() -> str:
     """Provide a sample category URL for testing."""
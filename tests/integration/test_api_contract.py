@@ -5,43 +5,22 @@ which is critical for the FastAPI migration.
 """
 
 import json
-import tempfile
-from pathlib import Path
+import shutil
 from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlmodel import Session, create_engine
 
-from src.cdon_watcher.cdon_scraper import CDONScraper
-
-# DatabaseManager was removed - using CDONScraper for database initialization
-from src.cdon_watcher.product_parser import Movie
+from src.cdon_watcher.models import Movie, PriceHistory
 from src.cdon_watcher.web.app import create_app
 
 
-@pytest.fixture
-def temp_db_path():
-    """Provide a temporary database path for tests."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp_file:
-        temp_path = tmp_file.name
-
-    yield temp_path
-
-    # Clean up
-    temp_file_path = Path(temp_path)
-    if temp_file_path.exists():
-        temp_file_path.unlink()
-
-
 @pytest.fixture
 def app(temp_db_path, monkeypatch):
     """Create FastAPI app instance for testing."""
     monkeypatch.setenv("DB_PATH", temp_db_path)
 
-    from src.cdon_watcher.config import CONFIG
-
-    monkeypatch.setitem(CONFIG, "db_path", temp_db_path)
-
     app = create_app()
     return app
 
@@ -53,42 +32,55 @@ def client(app):
 
 
 @pytest.fixture
-def populated_client(temp_db_path, monkeypatch):
+def populated_client(temp_db_path, schema_template_db, monkeypatch):
     """Create client with populated database."""
     monkeypatch.setenv("DB_PATH", temp_db_path)
 
-    from src.cdon_watcher.config import CONFIG
-
-    monkeypatch.setitem(CONFIG, "db_path", temp_db_path)
-
-    # Initialize database schema
-    scraper = CDONScraper(temp_db_path)
-    scraper.close()
+    # Copy the pre-built schema instead of creating it per test
+    shutil.copyfile(schema_template_db, temp_db_path)
 
     test_movies = [
-        Movie(
-            title="Contract Test Movie 1",
-            format="Blu-ray",
-            url="https://cdon.fi/tuote/contract-test-1",
-            image_url="https://cdon.fi/images/contract1.jpg",
-            price=29.99,
-            availability="In Stock",
-            product_id="contract-test-1",
+        (
+            Movie(
+                title="Contract Test Movie 1",
+                format="Blu-ray",
+                url="https://cdon.fi/tuote/contract-test-1",
+                image_url="https://cdon.fi/images/contract1.jpg",
+                product_id="contract-test-1",
+            ),
+            29.99,
         ),
-        Movie(
-            title="Contract Test Movie 2 4K",
-            format="4K UHD Blu-ray",
-            url="https://cdon.fi/tuote/contract-test-2",
-            image_url="https://cdon.fi/images/contract2.jpg",
-            price=39.99,
-            availability="In Stock",
-            product_id="contract-test-2",
+        (
+            Movie(
+                title="Contract Test Movie 2 4K",
+                format="4K UHD Blu-ray",
+                url="https://cdon.fi/tuote/contract-test-2",
+                image_url="https://cdon.fi/images/contract2.jpg",
+                product_id="contract-test-2",
+            ),
+            39.99,
         ),
     ]
 
     # Save movies and create test data
-    scraper.save_movies(test_movies)
-    scraper.close()
+    engine = create_engine(f"sqlite:///{temp_db_path}")
+    with Session(engine) as session:
+        # One flush assigns every movie ID, then the price rows go in as a single batch
+        session.add_all([movie for movie, _ in test_movies])
+        session.flush()
+        session.add_all(
+            [
+                PriceHistory(
+                    movie_id=movie.id,
+                    product_id=movie.product_id,
+                    price=price,
+                    availability="In Stock",
+                )
+                for movie, price in test_movies
+            ]
+        )
+        session.commit()
+    engine.dispose()
 
     # Return FastAPI test client
     app = create_app()
@@ -1,42 +1,19 @@
 """Integration tests for FastAPI web API endpoints."""
 
-import tempfile
-from pathlib import Path
+import shutil
 
 import pytest
 from fastapi.testclient import TestClient
 
-from src.cdon_watcher.cdon_scraper import CDONScraper
-
-# DatabaseManager was removed - using CDONScraper for database initialization
 from src.cdon_watcher.web.app import create_app
 
 
-@pytest.fixture
-def temp_db_path():
-    """Provide a temporary database path for tests."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp_file:
-        temp_path = tmp_file.name
-
-    yield temp_path
-
-    # Clean up
-    temp_file_path = Path(temp_path)
-    if temp_file_path.exists():
-        temp_file_path.unlink()
-
-
 @pytest.fixture
 def app(temp_db_path, monkeypatch):
     """Create FastAPI app instance for testing."""
-    # Mock the CONFIG to use our test database
+    # Point the lazily created engine at our test database
     monkeypatch.setenv("DB_PATH", temp_db_path)
 
-    # Import after setting environment variable
-    from src.cdon_watcher.config import CONFIG
-
-    monkeypatch.setitem(CONFIG, "db_path", temp_db_path)
-
     app = create_app()
     return app
 
@@ -48,11 +25,10 @@ def client(app):
 
 
 @pytest.fixture
-def populated_db(temp_db_path):
+def populated_db(temp_db_path, schema_template_db):
     """Create an initialized database."""
-    # Initialize database schema only
-    scraper = CDONScraper(temp_db_path)
-    scraper.close()
+    # Copy the pre-built schema instead of creating it per test
+    shutil.copyfile(schema_template_db, temp_db_path)
     return temp_db_path
 
 
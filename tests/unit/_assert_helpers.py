@@ -0,0 +1,23 @@
+"""Plain assertion helpers shared by the unit tests.
+
+This module is deliberately not registered with ``pytest.register_assert_rewrite``,
+so pytest imports it as-is instead of rewriting its asserts.
+"""
+
+import functools
+import re
+
+
+@functools.cache
+def _needle_pattern(needles: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile one alternation matching any of the needles, longest first."""
+    return re.compile("|".join(map(re.escape, sorted(needles, key=len, reverse=True))))
+
+
+def assert_contains(output: str, *needles: str) -> None:
+    """Assert that every needle occurs in output using a single regex scan."""
+    __tracebackhide__ = True
+    found = set(_needle_pattern(needles).findall(output))
+    # Overlapping needles can hide each other from findall, so re-check only those
+    missing = [needle for needle in needles if needle not in found and needle not in output]
+    assert not missing, f"Missing from output: {missing}"
@@ -0,0 +1,53 @@
+"""Shared fixtures for unit tests backed by a seeded in-memory database."""
+
+import sqlite3
+from collections.abc import AsyncGenerator, Callable
+from contextlib import closing
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlmodel import Session
+
+
+def _no_seed(_session: Session) -> None:
+    """Leave the template database with the schema only."""
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def test_db_engine(
+    request: pytest.FixtureRequest,
+    memory_db_uri: str,
+    sqlite_template_factory: Callable[[Callable[[Session], None]], sqlite3.Connection],
+    sqlite_engine_factory: Callable[[str], AsyncEngine],
+) -> AsyncGenerator[AsyncEngine, None]:
+    """Create one engine per module over a database seeded by the module's seed marker.
+
+    Modules declare their data with ``pytest.mark.seed.with_args(populate)``; the seed runs once
+    into a template that is restored into the module's database with a page copy.
+    """
+    marker = request.node.get_closest_marker("seed")
+    template = sqlite_template_factory(marker.args[0] if marker else _no_seed)
+
+    with closing(sqlite3.connect(memory_db_uri, uri=True)) as target:
+        template.backup(target)
+
+    engine = sqlite_engine_factory(memory_db_uri)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def test_db_session(test_db_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """Create a test session whose changes are rolled back after each test."""
+    async with test_db_engine.connect() as conn:
+        outer = await conn.begin()
+        # Commits inside the test only release a SAVEPOINT of the outer transaction
+        session = AsyncSession(
+            bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await outer.rollback()
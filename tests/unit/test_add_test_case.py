@@ -1,7 +1,6 @@
 """Unit tests for test case management utilities."""
 
 import json
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -177,7 +176,7 @@ class TestDataPersistence:
             expected = {"test_cases": []}
             assert result == expected, "Should return default structure for nonexistent file"
 
-    def test_load_test_data_existing_file(self) -> None:
+    def test_load_test_data_existing_file(self, tmp_path: Path) -> None:
         """Test loading test data from existing file."""
         test_data = {
             "test_cases": [
@@ -193,22 +192,17 @@ class TestDataPersistence:
             ]
         }
 
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(test_data, f)
-            temp_path = f.name
-
-        try:
-            # Mock the path to point to our temp file
-            with patch("src.cdon_watcher.add_test_case.os.path.join", return_value=temp_path):
-                with patch("src.cdon_watcher.add_test_case.os.path.exists", return_value=True):
-                    result = load_test_data()
-                    assert result == test_data, "Should load existing test data"
-        finally:
-            # Clean up
-            Path(temp_path).unlink()
-
-    def test_save_test_data(self) -> None:
+        # Write the data into pytest's per-test directory, which it cleans up itself
+        temp_path = tmp_path / "test_urls.json"
+        temp_path.write_text(json.dumps(test_data))
+
+        # Mock the path to point to our temp file
+        with patch("src.cdon_watcher.add_test_case.os.path.join", return_value=str(temp_path)):
+            with patch("src.cdon_watcher.add_test_case.os.path.exists", return_value=True):
+                result = load_test_data()
+                assert result == test_data, "Should load existing test data"
+
+    def test_save_test_data(self, tmp_path: Path) -> None:
         """Test saving test data to JSON file."""
         test_data = {
             "test_cases": [
@@ -224,24 +218,17 @@ class TestDataPersistence:
             ]
         }
 
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            temp_path = f.name
+        temp_path = tmp_path / "test_urls.json"
 
-        try:
-            # Mock the path to point to our temp file
-            with patch("src.cdon_watcher.add_test_case.os.path.join", return_value=temp_path):
-                save_test_data(test_data)
+        # Mock the path to point to our temp file
+        with patch("src.cdon_watcher.add_test_case.os.path.join", return_value=str(temp_path)):
+            save_test_data(test_data)
 
-                # Verify file was written correctly
-                with open(temp_path) as f:
-                    saved_data = json.load(f)
-                    assert saved_data == test_data, "Should save test data correctly"
-        finally:
-            # Clean up
-            Path(temp_path).unlink()
+            # Verify file was written correctly
+            saved_data = json.loads(temp_path.read_text())
+            assert saved_data == test_data, "Should save test data correctly"
 
-    def test_save_load_roundtrip(self) -> None:
+    def test_save_load_roundtrip(self, tmp_path: Path) -> None:
         """Test that save/load operations are consistent."""
         original_data = {
             "test_cases": [
@@ -266,20 +253,14 @@ class TestDataPersistence:
             ]
         }
 
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            temp_path = f.name
-
-        try:
-            # Mock the path for both save and load
-            with patch("src.cdon_watcher.add_test_case.os.path.join", return_value=temp_path):
-                # Save data
-                save_test_data(original_data)
-
-                # Load data back
-                with patch("src.cdon_watcher.add_test_case.os.path.exists", return_value=True):
-                    loaded_data = load_test_data()
-                    assert loaded_data == original_data, "Save/load should be consistent"
-        finally:
-            # Clean up
-            Path(temp_path).unlink()
+        temp_path = str(tmp_path / "test_urls.json")
+
+        # Mock the path for both save and load
+        with patch("src.cdon_watcher.add_test_case.os.path.join", return_value=temp_path):
+            # Save data
+            save_test_data(original_data)
+
+            # Load data back
+            with patch("src.cdon_watcher.add_test_case.os.path.exists", return_value=True):
+                loaded_data = load_test_data()
+                assert loaded_data == original_data, "Save/load should be consistent"
@@ -5,7 +5,7 @@ from unittest.mock import patch
 
 import pytest
 
-from src.cdon_watcher.config import load_config
+from src.cdon_watcher.config import DEFAULT_DB_PATH, get_db_path, load_config
 
 
 class TestConfigLoading:
@@ -22,10 +22,18 @@ class TestConfigLoading:
             assert config["api_host"] == "0.0.0.0"
             assert config["api_port"] == 8080
             assert config["api_debug"] is False
-            assert config["db_path"] == "./data/cdon_movies.db"
+            assert get_db_path() == DEFAULT_DB_PATH == "./data/cdon_movies.db"
             assert config["tmdb_api_key"] == ""
             assert config["poster_dir"] == "./data/posters"
 
+    def test_get_db_path_reads_environment_lazily(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that get_db_path picks up DB_PATH changes without reloading config."""
+        monkeypatch.delenv("DB_PATH", raising=False)
+        assert get_db_path() == DEFAULT_DB_PATH
+
+        monkeypatch.setenv("DB_PATH", "/custom/lazy.db")
+        assert get_db_path() == "/custom/lazy.db"
+
     def test_load_config_custom_values(self) -> None:
         """Test configuration loading with custom environment values."""
         custom_env = {
@@ -48,7 +56,7 @@ class TestConfigLoading:
             assert config["api_host"] == "127.0.0.1"
             assert config["api_port"] == 3000
             assert config["api_debug"] is True
-            assert config["db_path"] == "/custom/path/movies.db"
+            assert get_db_path() == "/custom/path/movies.db"
             assert config["tmdb_api_key"] == "tmdb_key_123"
             assert config["poster_dir"] == "/custom/posters"
 
@@ -108,7 +116,7 @@ class TestConfigLoading:
             # Check overridden values
             assert config["check_interval_hours"] == 8
             assert config["api_debug"] is False
-            assert config["db_path"] == "/custom/db.sqlite"
+            assert get_db_path() == "/custom/db.sqlite"
 
             # Check default values still apply
             assert config["api_host"] == "0.0.0.0"
@@ -1,7 +1,15 @@
 """Unit tests for SQLModel database models."""
 
-from datetime import UTC, datetime
+import functools
+from collections.abc import Generator
+from datetime import UTC, datetime, tzinfo
+from typing import Any
 
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlmodel import SQLModel
+
+from src.cdon_watcher import models
 from src.cdon_watcher.models import (
     DealMovie,
     IgnoredMovie,
@@ -13,155 +21,205 @@ from src.cdon_watcher.models import (
     WatchlistMovie,
 )
 
+# Pure formatting/model tests: skip per-test warning filter bookkeeping
+pytestmark = [pytest.mark.filterwarnings("ignore")]
+
+# Shared timestamp for view-model fixtures; tests never assert on its value
+_NOW = datetime.now(UTC)
+
+
+class _FrozenDatetime(datetime):
+    """datetime stand-in whose now() always returns the shared timestamp."""
+
+    @classmethod
+    def now(cls, tz: tzinfo | None = None) -> datetime:  # type: ignore[override]
+        return _NOW
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _frozen_model_clock() -> Generator[None, None, None]:
+    """Freeze the clock behind the model default factories for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(models, "datetime", _FrozenDatetime)
+        yield
+
+
+# (constructor kwargs, expected attributes); a type as the expected value means isinstance
+_MOVIE_CASES = (
+    pytest.param(
+        {
+            "product_id": "abc123",
+            "title": "Batman (1989)",
+            "format": "4K Blu-ray",
+            "url": "https://cdon.fi/tuote/batman-abc123/",
+            "image_url": "https://example.com/image.jpg",
+            "production_year": 1989,
+            "tmdb_id": 268,
+            "content_type": "movie",
+        },
+        {
+            "product_id": "abc123",
+            "title": "Batman (1989)",
+            "format": "4K Blu-ray",
+            "production_year": 1989,
+            "tmdb_id": 268,
+            "content_type": "movie",
+        },
+        id="with_production_year",
+    ),
+    pytest.param(
+        {"product_id": "xyz789", "title": "Unknown Movie", "format": "Blu-ray"},
+        {"product_id": "xyz789", "title": "Unknown Movie", "production_year": None},
+        id="without_production_year",
+    ),
+    pytest.param(
+        {"product_id": "minimal123", "title": "Minimal Movie"},
+        {
+            "product_id": "minimal123",
+            "title": "Minimal Movie",
+            "format": None,
+            "production_year": None,
+            "tmdb_id": None,
+        },
+        id="minimal_fields",
+    ),
+    pytest.param(
+        {"product_id": "default123", "title": "Default Movie"},
+        {
+            "id": None,  # Primary key starts as None
+            "content_type": "movie",  # Default value
+            "first_seen": datetime,
+            "last_updated": datetime,
+        },
+        id="defaults",
+    ),
+)
 
-class TestMovieModel:
-    """Test cases for the Movie SQLModel."""
 
-    def test_movie_creation_with_production_year(self) -> None:
-        """Test creating a Movie with production year."""
-        movie = Movie(
-            product_id="abc123",
-            title="Batman (1989)",
-            format="4K Blu-ray",
-            url="https://cdon.fi/tuote/batman-abc123/",
-            image_url="https://example.com/image.jpg",
-            production_year=1989,
-            tmdb_id=268,
-            content_type="movie",
-        )
+@functools.cache
+def _movie_with_year(production_year: int) -> Movie:
+    """Build a Movie for read-only year assertions; cached since tests never mutate it."""
+    return Movie(
+        product_id=str(production_year),
+        title=f"Movie {production_year}",
+        production_year=production_year,
+    )
 
-        assert movie.product_id == "abc123"
-        assert movie.title == "Batman (1989)"
-        assert movie.format == "4K Blu-ray"
-        assert movie.production_year == 1989
-        assert movie.tmdb_id == 268
-        assert movie.content_type == "movie"
-
-    def test_movie_creation_without_production_year(self) -> None:
-        """Test creating a Movie without production year (None)."""
-        movie = Movie(
-            product_id="xyz789",
-            title="Unknown Movie",
-            format="Blu-ray",
-        )
-
-        assert movie.product_id == "xyz789"
-        assert movie.title == "Unknown Movie"
-        assert movie.production_year is None  # Should default to None
 
-    def test_movie_creation_minimal_fields(self) -> None:
-        """Test creating a Movie with only required fields."""
-        movie = Movie(
-            product_id="minimal123",
-            title="Minimal Movie",
-        )
+def _assert_fields(model: Any, expected: dict[str, Any]) -> None:
+    """Assert model attributes; a type as the expected value means isinstance."""
+    for field, value in expected.items():
+        actual = getattr(model, field)
+        if isinstance(value, type):
+            assert isinstance(actual, value), f"{field} should be a {value.__name__}"
+        else:
+            assert actual == value, f"{field} should be {value!r}"
 
-        assert movie.product_id == "minimal123"
-        assert movie.title == "Minimal Movie"
-        assert movie.format is None
-        assert movie.production_year is None
-        assert movie.tmdb_id is None
 
-    def test_movie_defaults(self) -> None:
-        """Test that Movie model has correct default values."""
-        movie = Movie(
-            product_id="default123",
-            title="Default Movie",
-        )
+class TestMovieModel:
+    """Test cases for the Movie SQLModel."""
 
-        assert movie.id is None  # Primary key starts as None
-        assert movie.content_type == "movie"  # Default value
-        assert isinstance(movie.first_seen, datetime)
-        assert isinstance(movie.last_updated, datetime)
+    @pytest.mark.parametrize("kwargs,expected", _MOVIE_CASES)
+    def test_movie_creation(self, kwargs: dict[str, Any], expected: dict[str, Any]) -> None:
+        """Test creating a Movie and reading back its fields and defaults."""
+        _assert_fields(Movie(**kwargs), expected)
+
+
+# (view model class, constructor kwargs, expected attributes)
+_VIEW_MODEL_CASES = (
+    pytest.param(
+        MovieWithPricing,
+        {
+            "id": 1,
+            "product_id": "pricing123",
+            "title": "Batman Returns",
+            "format": "4K Blu-ray",
+            "url": "https://example.com",
+            "image_url": "https://example.com/image.jpg",
+            "production_year": 1992,
+            "tmdb_id": 364,
+            "content_type": "movie",
+            "first_seen": _NOW,
+            "last_updated": _NOW,
+            "current_price": 19.99,
+            "lowest_price": 15.99,
+            "highest_price": 29.99,
+        },
+        {"production_year": 1992, "current_price": 19.99},
+        id="movie_with_pricing",
+    ),
+    pytest.param(
+        DealMovie,
+        {
+            "id": 2,
+            "product_id": "deal456",
+            "title": "The Dark Knight",
+            "format": "Blu-ray",
+            "url": "https://example.com",
+            "image_url": "https://example.com/image.jpg",
+            "production_year": 2008,
+            "tmdb_id": 155,
+            "current_price": 12.99,
+            "previous_price": 19.99,
+            "price_change": -7.00,
+            "lowest_price": 12.99,
+            "highest_price": 24.99,
+        },
+        {"production_year": 2008, "price_change": -7.00},
+        id="deal_movie",
+    ),
+    pytest.param(
+        WatchlistMovie,
+        {
+            "id": 3,
+            "product_id": "watch789",
+            "title": "Batman Begins",
+            "format": "4K Blu-ray",
+            "url": "https://example.com",
+            "image_url": "https://example.com/image.jpg",
+            "production_year": 2005,
+            "tmdb_id": 272,
+            "content_type": "movie",
+            "first_seen": _NOW,
+            "last_updated": _NOW,
+            "target_price": 15.00,
+            "current_price": 18.99,
+            "lowest_price": 14.99,
+            "highest_price": 22.99,
+        },
+        {"production_year": 2005, "target_price": 15.00},
+        id="watchlist_movie",
+    ),
+    pytest.param(
+        MovieWithPricing,
+        {
+            "id": 4,
+            "product_id": "none123",
+            "title": "Unknown Year Movie",
+            "format": "DVD",
+            "url": "https://example.com",
+            "image_url": None,
+            "production_year": None,  # Explicitly None
+            "tmdb_id": None,
+            "content_type": "movie",
+            "first_seen": _NOW,
+            "last_updated": _NOW,
+        },
+        {"production_year": None, "title": "Unknown Year Movie"},
+        id="none_production_year",
+    ),
+)
 
 
 class TestViewModels:
     """Test cases for view-specific model variants."""
 
-    def test_movie_with_pricing_includes_production_year(self) -> None:
-        """Test that MovieWithPricing includes production_year field."""
-        movie = MovieWithPricing(
-            id=1,
-            product_id="pricing123",
-            title="Batman Returns",
-            format="4K Blu-ray",
-            url="https://example.com",
-            image_url="https://example.com/image.jpg",
-            production_year=1992,
-            tmdb_id=364,
-            content_type="movie",
-            first_seen=datetime.now(UTC),
-            last_updated=datetime.now(UTC),
-            current_price=19.99,
-            lowest_price=15.99,
-            highest_price=29.99,
-        )
-
-        assert movie.production_year == 1992
-        assert movie.current_price == 19.99
-
-    def test_deal_movie_includes_production_year(self) -> None:
-        """Test that DealMovie includes production_year field."""
-        deal = DealMovie(
-            id=2,
-            product_id="deal456",
-            title="The Dark Knight",
-            format="Blu-ray",
-            url="https://example.com",
-            image_url="https://example.com/image.jpg",
-            production_year=2008,
-            tmdb_id=155,
-            current_price=12.99,
-            previous_price=19.99,
-            price_change=-7.00,
-            lowest_price=12.99,
-            highest_price=24.99,
-        )
-
-        assert deal.production_year == 2008
-        assert deal.price_change == -7.00
-
-    def test_watchlist_movie_includes_production_year(self) -> None:
-        """Test that WatchlistMovie includes production_year field."""
-        watchlist_movie = WatchlistMovie(
-            id=3,
-            product_id="watch789",
-            title="Batman Begins",
-            format="4K Blu-ray",
-            url="https://example.com",
-            image_url="https://example.com/image.jpg",
-            production_year=2005,
-            tmdb_id=272,
-            content_type="movie",
-            first_seen=datetime.now(UTC),
-            last_updated=datetime.now(UTC),
-            target_price=15.00,
-            current_price=18.99,
-            lowest_price=14.99,
-            highest_price=22.99,
-        )
-
-        assert watchlist_movie.production_year == 2005
-        assert watchlist_movie.target_price == 15.00
-
-    def test_view_models_with_none_production_year(self) -> None:
-        """Test view models when production_year is None."""
-        movie_with_pricing = MovieWithPricing(
-            id=4,
-            product_id="none123",
-            title="Unknown Year Movie",
-            format="DVD",
-            url="https://example.com",
-            image_url=None,
-            production_year=None,  # Explicitly None
-            tmdb_id=None,
-            content_type="movie",
-            first_seen=datetime.now(UTC),
-            last_updated=datetime.now(UTC),
-        )
-
-        assert movie_with_pricing.production_year is None
-        assert movie_with_pricing.title == "Unknown Year Movie"
+    @pytest.mark.parametrize("model_cls,kwargs,expected", _VIEW_MODEL_CASES)
+    def test_view_model_includes_production_year(
+        self, model_cls: type[SQLModel], kwargs: dict[str, Any], expected: dict[str, Any]
+    ) -> None:
+        """Test that view models carry production_year alongside their pricing fields."""
+        _assert_fields(model_cls(**kwargs), expected)
 
 
 class TestRelatedModels:
@@ -226,14 +284,11 @@ class TestProductionYearValidation:
 
     def test_production_year_valid_ranges(self) -> None:
         """Test various valid production year values."""
-        # Test boundary values
-        movie_1900 = Movie(product_id="1900", title="Old Movie", production_year=1900)
-        movie_2030 = Movie(product_id="2030", title="Future Movie", production_year=2030)
-        movie_current = Movie(product_id="current", title="Current Movie", production_year=2024)
-
-        assert movie_1900.production_year == 1900
-        assert movie_2030.production_year == 2030
-        assert movie_current.production_year == 2024
+        # Test boundary values and a current year
+        for year in (1900, 2030, 2024):
+            movie = _movie_with_year(year)
+            assert movie.production_year == year
+            assert type(movie.production_year) is int
 
     def test_production_year_none_handling(self) -> None:
         """Test that None values are handled correctly."""
@@ -248,13 +303,52 @@ class TestProductionYearValidation:
         movie.production_year = None
         assert movie.production_year is None
 
-    def test_production_year_type_flexibility(self) -> None:
-        """Test that production year accepts proper integer types."""
-        # Test with different ways of specifying integers
-        movie1 = Movie(product_id="int1", title="Movie 1", production_year=1989)
-        movie2 = Movie(product_id="int2", title="Movie 2", production_year=1989)
 
-        assert movie1.production_year == 1989
-        assert movie2.production_year == 1989
-        assert isinstance(movie1.production_year, int)
-        assert isinstance(movie2.production_year, int)
+class TestLookupIndexes:
+    """Test that watchlist and ignore lookups are backed by unique indexes."""
+
+    def test_watchlist_and_ignored_movies_lookup_columns_are_unique(self) -> None:
+        """Test that both lookup keys are unique, so queries seek instead of scanning."""
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine)
+        inspector = inspect(engine)
+
+        for table in ("watchlist", "ignored_movies"):
+            unique_columns = {
+                tuple(index["column_names"])
+                for index in inspector.get_indexes(table)
+                if index["unique"]
+            }
+            unique_columns.update(
+                tuple(constraint["column_names"])
+                for constraint in inspector.get_unique_constraints(table)
+            )
+
+            assert ("product_id",) in unique_columns
+            assert ("movie_id",) in unique_columns
+
+        engine.dispose()
+
+    def test_product_id_indexes_exist(self) -> None:
+        """Test that every table carrying product_id indexes it."""
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine)
+
+        # Let SQLite compute the set difference in a single query
+        with engine.connect() as conn:
+            missing = conn.execute(
+                text(
+                    "WITH expected(name) AS (VALUES "
+                    "('ix_movies_product_id'), "
+                    "('ix_watchlist_product_id'), "
+                    "('ix_price_history_product_id'), "
+                    "('ix_price_alerts_product_id'), "
+                    "('ix_ignored_movies_product_id')) "
+                    "SELECT name FROM expected "
+                    "WHERE name NOT IN (SELECT name FROM sqlite_master WHERE type = 'index')"
+                )
+            ).all()
+
+        assert not missing
+
+        engine.dispose()
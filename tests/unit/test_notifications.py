@@ -1,65 +1,120 @@
 """Unit tests for notification services."""
 
-from io import StringIO
-from unittest.mock import patch
+import re
+from collections import Counter
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 import pytest
 
-from src.cdon_watcher.notifications import NotificationService
+from tests.unit._assert_helpers import assert_contains
+
+# Pure formatting/model tests: skip per-test warning filter bookkeeping
+pytestmark = [pytest.mark.filterwarnings("ignore")]
+
+if TYPE_CHECKING:
+    # Imported lazily in the fixture; notifications pulls in aiohttp at import time
+    from src.cdon_watcher.notifications import NotificationService
+
+# Immutable alert prototypes; tests copy them and override only the fields they vary
+_DROP_ALERT = MappingProxyType(
+    {
+        "alert_type": "price_drop",
+        "title": "Test Movie",
+        "old_price": 29.99,
+        "new_price": 19.99,
+        "url": "https://cdon.fi/tuote/test/",
+    }
+)
+_TARGET_ALERT = MappingProxyType(
+    {
+        "alert_type": "target_reached",
+        "title": "Test Movie",
+        "old_price": 30.00,
+        "new_price": 20.00,
+        "url": "https://cdon.fi/tuote/test/",
+    }
+)
+
+_PRICE_CASES = (
+    (29.99, 19.99, "€29.99", "€19.99"),
+    (15.0, 12.5, "€15.0", "€12.5"),
+    (100, 75, "€100", "€75"),
+    (0.99, 0.50, "€0.99", "€0.5"),
+)
+
+
+# Titles, price transitions, target prices and View labels in one pass over the output
+_MULTI_ALERT_PATTERN = re.compile(
+    r"(?:📉|🎯) Movie [AB]|€\d+(?:\.\d+)? → €\d+(?:\.\d+)?|reached: €\d+(?:\.\d+)?|View:"
+)
+
+
+def _print_alerts(
+    service: "NotificationService", alerts: list[dict], capsys: pytest.CaptureFixture[str]
+) -> str:
+    """Print alerts to the console and return the captured output."""
+    service._print_console_alerts(alerts)
+    return capsys.readouterr().out
 
 
 class TestNotificationFormatting:
     """Test notification formatting functions that don't require external services."""
 
-    @pytest.fixture
-    def notification_service(self) -> NotificationService:
-        """Create NotificationService instance for testing."""
+    @pytest.fixture(scope="module")
+    def notification_service(self) -> "NotificationService":
+        """Create a NotificationService shared by the module (it holds no state)."""
+        from src.cdon_watcher.notifications import NotificationService
+
         return NotificationService()
 
     def test_print_console_alerts_empty_list(
-        self, notification_service: NotificationService
+        self,
+        notification_service: "NotificationService",
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test console alert printing with empty alert list."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            notification_service._print_console_alerts([])
-            output = mock_stdout.getvalue()
-            # Function always prints header, even for empty list
-            assert "PRICE ALERTS!" in output, "Should print header even for empty list"
-            # But should not print any specific alert content
-            assert "📉" not in output, "Should not print price drop emoji"
-            assert "🎯" not in output, "Should not print target reached emoji"
+        output = _print_alerts(notification_service, [], capsys)
+        # Function always prints header, even for empty list
+        assert "PRICE ALERTS!" in output, "Should print header even for empty list"
+        # But should not print any specific alert content
+        assert "📉" not in output, "Should not print price drop emoji"
+        assert "🎯" not in output, "Should not print target reached emoji"
 
     def test_print_console_alerts_price_drop(
-        self, notification_service: NotificationService
+        self,
+        notification_service: "NotificationService",
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test console alert printing for price drop alerts."""
         alerts = [
             {
-                "alert_type": "price_drop",
+                **_DROP_ALERT,
                 "title": "The Matrix Blu-ray",
-                "old_price": 29.99,
-                "new_price": 19.99,
                 "url": "https://cdon.fi/tuote/matrix-abc123/",
             }
         ]
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            notification_service._print_console_alerts(alerts)
-            output = mock_stdout.getvalue()
+        output = _print_alerts(notification_service, alerts, capsys)
 
-            # Check that output contains expected elements
-            assert "PRICE ALERTS!" in output
-            assert "📉 The Matrix Blu-ray" in output
-            assert "Price dropped: €29.99 → €19.99" in output
-            assert "https://cdon.fi/tuote/matrix-abc123/" in output
+        # Check that output contains expected elements
+        assert_contains(
+            output,
+            "PRICE ALERTS!",
+            "📉 The Matrix Blu-ray",
+            "Price dropped: €29.99 → €19.99",
+            "https://cdon.fi/tuote/matrix-abc123/",
+        )
 
     def test_print_console_alerts_target_reached(
-        self, notification_service: NotificationService
+        self,
+        notification_service: "NotificationService",
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test console alert printing for target price reached alerts."""
         alerts = [
             {
-                "alert_type": "target_reached",
+                **_TARGET_ALERT,
                 "title": "Blade Runner 2049 4K",
                 "old_price": 35.00,
                 "new_price": 25.00,
@@ -67,139 +122,111 @@ class TestNotificationFormatting:
             }
         ]
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            notification_service._print_console_alerts(alerts)
-            output = mock_stdout.getvalue()
+        output = _print_alerts(notification_service, alerts, capsys)
 
-            # Check that output contains expected elements
-            assert "🎯 Blade Runner 2049 4K" in output
-            assert "Target price reached: €25.0" in output
-            assert "https://cdon.fi/tuote/blade-runner-def456/" in output
+        # Check that output contains expected elements
+        assert_contains(
+            output,
+            "🎯 Blade Runner 2049 4K",
+            "Target price reached: €25.0",
+            "https://cdon.fi/tuote/blade-runner-def456/",
+        )
 
     def test_print_console_alerts_multiple_alerts(
-        self, notification_service: NotificationService
+        self,
+        notification_service: "NotificationService",
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test console alert printing with multiple alerts."""
         alerts = [
             {
-                "alert_type": "price_drop",
+                **_DROP_ALERT,
                 "title": "Movie A",
                 "old_price": 20.00,
                 "new_price": 15.00,
                 "url": "https://cdon.fi/tuote/movie-a/",
             },
             {
-                "alert_type": "target_reached",
+                **_TARGET_ALERT,
                 "title": "Movie B",
-                "old_price": 30.00,
                 "new_price": 25.00,
                 "url": "https://cdon.fi/tuote/movie-b/",
             },
         ]
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            notification_service._print_console_alerts(alerts)
-            output = mock_stdout.getvalue()
+        output = _print_alerts(notification_service, alerts, capsys)
 
-            # Check that both alerts are present
-            assert "📉 Movie A" in output
-            assert "🎯 Movie B" in output
-            assert "€20.0 → €15.0" in output
-            assert "€25.0" in output
-            assert output.count("View:") == 2, "Should have two 'View:' entries"
+        # Check that both alerts are present, with one 'View:' entry each
+        assert Counter(_MULTI_ALERT_PATTERN.findall(output)) == Counter(
+            {
+                "📉 Movie A": 1,
+                "🎯 Movie B": 1,
+                "€20.0 → €15.0": 1,
+                "reached: €25.0": 1,
+                "View:": 2,
+            }
+        )
 
     def test_print_console_alerts_unknown_alert_type(
-        self, notification_service: NotificationService
+        self,
+        notification_service: "NotificationService",
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test console alert printing with unknown alert type."""
         alerts = [
-            {
-                "alert_type": "unknown_type",
-                "title": "Test Movie",
-                "old_price": 20.00,
-                "new_price": 15.00,
-                "url": "https://cdon.fi/tuote/test/",
-            }
+            {**_DROP_ALERT, "alert_type": "unknown_type", "old_price": 20.00, "new_price": 15.00}
         ]
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            notification_service._print_console_alerts(alerts)
-            output = mock_stdout.getvalue()
+        output = _print_alerts(notification_service, alerts, capsys)
 
-            # Should still print basic info but without specific emoji/message
-            assert "PRICE ALERTS!" in output
-            assert "https://cdon.fi/tuote/test/" in output  # URL always printed
-            # Should not contain price drop or target reached messages
-            assert "Price dropped:" not in output
-            assert "Target price reached:" not in output
-            # For unknown alert types, title is not printed with emoji prefix
-            assert "📉" not in output
-            assert "🎯" not in output
+        # Should still print basic info (the URL is always printed) but no emoji/message
+        assert_contains(output, "PRICE ALERTS!", "https://cdon.fi/tuote/test/")
+        # Should not contain price drop or target reached messages
+        assert "Price dropped:" not in output
+        assert "Target price reached:" not in output
+        # For unknown alert types, title is not printed with emoji prefix
+        assert "📉" not in output
+        assert "🎯" not in output
 
     def test_print_console_alerts_formatting(
-        self, notification_service: NotificationService
+        self,
+        notification_service: "NotificationService",
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Test console alert formatting details."""
-        alerts = [
-            {
-                "alert_type": "price_drop",
-                "title": "Test Movie",
-                "old_price": 29.99,
-                "new_price": 19.99,
-                "url": "https://cdon.fi/tuote/test/",
-            }
-        ]
+        alerts = [dict(_DROP_ALERT)]
+
+        output = _print_alerts(notification_service, alerts, capsys)
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            notification_service._print_console_alerts(alerts)
-            output = mock_stdout.getvalue()
-
-            # Check formatting elements
-            assert "=" * 50 in output, "Should have header separator"
-            assert output.count("🎉") >= 1, "Should have celebration emoji"
-            assert "View:" in output, "Should have View label"
-
-    @pytest.mark.parametrize(
-        "old_price,new_price,expected_old,expected_new",
-        [
-            (29.99, 19.99, "€29.99", "€19.99"),
-            (15.0, 12.5, "€15.0", "€12.5"),
-            (100, 75, "€100", "€75"),
-            (0.99, 0.50, "€0.99", "€0.5"),
-        ],
-    )
+        # Check formatting elements: header separator, celebration emoji and View label
+        assert_contains(output, "=" * 50, "🎉", "View:")
+
+    @pytest.mark.parametrize("old_price,new_price,expected_old,expected_new", _PRICE_CASES)
     def test_price_formatting_in_alerts(
         self,
-        notification_service: NotificationService,
+        notification_service: "NotificationService",
+        capsys: pytest.CaptureFixture[str],
         old_price: float,
         new_price: float,
         expected_old: str,
         expected_new: str,
     ) -> None:
         """Test price formatting in alert messages."""
-        alerts = [
-            {
-                "alert_type": "price_drop",
-                "title": "Test Movie",
-                "old_price": old_price,
-                "new_price": new_price,
-                "url": "https://cdon.fi/tuote/test/",
-            }
-        ]
+        alerts = [{**_DROP_ALERT, "old_price": old_price, "new_price": new_price}]
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            notification_service._print_console_alerts(alerts)
-            output = mock_stdout.getvalue()
+        output = _print_alerts(notification_service, alerts, capsys)
 
-            assert f"{expected_old} → {expected_new}" in output, (
-                f"Should format prices as {expected_old} → {expected_new}"
-            )
+        assert f"{expected_old} → {expected_new}" in output, (
+            f"Should format prices as {expected_old} → {expected_new}"
+        )
 
-    def test_unicode_handling_in_alerts(self, notification_service: NotificationService) -> None:
+    def test_unicode_handling_in_alerts(
+        self, notification_service: "NotificationService", capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test handling of unicode characters in alert messages."""
         alerts = [
             {
-                "alert_type": "price_drop",
+                **_DROP_ALERT,
                 "title": "Amélie - Blu-ray édition spéciale",
                 "old_price": 25.50,
                 "new_price": 18.99,
@@ -207,31 +234,21 @@ class TestNotificationFormatting:
             }
         ]
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            notification_service._print_console_alerts(alerts)
-            output = mock_stdout.getvalue()
+        output = _print_alerts(notification_service, alerts, capsys)
 
-            # Should handle unicode characters properly
-            assert "Amélie - Blu-ray édition spéciale" in output
-            assert "€25.5 → €18.99" in output
+        # Should handle unicode characters properly
+        assert_contains(output, "Amélie - Blu-ray édition spéciale", "€25.5 → €18.99")
 
-    def test_long_title_handling(self, notification_service: NotificationService) -> None:
+    def test_long_title_handling(
+        self, notification_service: "NotificationService", capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test handling of very long movie titles."""
         long_title = "This Is A Very Long Movie Title That Contains Many Words And Characters To Test Display Formatting"
         alerts = [
-            {
-                "alert_type": "target_reached",
-                "title": long_title,
-                "old_price": 30.00,
-                "new_price": 20.00,
-                "url": "https://cdon.fi/tuote/long-title/",
-            }
+            {**_TARGET_ALERT, "title": long_title, "url": "https://cdon.fi/tuote/long-title/"}
         ]
 
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            notification_service._print_console_alerts(alerts)
-            output = mock_stdout.getvalue()
+        output = _print_alerts(notification_service, alerts, capsys)
 
-            # Should include the full title without truncation
-            assert long_title in output
-            assert "Target price reached: €20.0" in output
+        # Should include the full title without truncation
+        assert_contains(output, long_title, "Target price reached: €20.0")
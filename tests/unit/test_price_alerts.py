@@ -0,0 +1,154 @@
+"""Unit tests for price alert detection when a scraped price is saved."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlmodel import insert, select
+
+from src.cdon_watcher.cdon_scraper import CDONScraper
+from src.cdon_watcher.models import Movie, PriceAlert, PriceHistory, Watchlist
+
+# product_id -> earlier prices, oldest first
+_PRICE_HISTORY: dict[str, tuple[float, ...]] = {
+    "drop-1": (25.00, 20.00),
+    "single-1": (),
+    "watch-1": (30.00,),
+}
+
+# watch-1 is watchlisted with a target below its last price
+_WATCHLIST_TARGETS: tuple[tuple[str, float], ...] = (("watch-1", 25.00),)
+
+
+def _populate_test_data(session):
+    """Populate database with movies, their earlier prices and a watchlist target."""
+    now = datetime.now(UTC)
+
+    result = session.execute(
+        insert(Movie).returning(Movie.product_id, Movie.id),
+        [
+            {
+                "product_id": product_id,
+                "title": f"Test Movie {product_id}",
+                "format": "Blu-ray",
+                "url": f"https://cdon.fi/{product_id}",
+                "first_seen": now,
+                "last_updated": now,
+            }
+            for product_id in _PRICE_HISTORY
+        ],
+    )
+    movie_ids = dict(result.tuples().all())
+
+    # Earlier prices are a day apart and all older than the price saved by the tests
+    session.execute(
+        insert(PriceHistory),
+        [
+            {
+                "movie_id": movie_ids[product_id],
+                "product_id": product_id,
+                "price": price,
+                "checked_at": now - timedelta(days=len(prices) - index),
+            }
+            for product_id, prices in _PRICE_HISTORY.items()
+            for index, price in enumerate(prices)
+        ],
+    )
+
+    session.execute(
+        insert(Watchlist),
+        [
+            {
+                "movie_id": movie_ids[product_id],
+                "product_id": product_id,
+                "target_price": target_price,
+                "created_at": now,
+            }
+            for product_id, target_price in _WATCHLIST_TARGETS
+        ],
+    )
+
+    session.commit()
+
+
+# Tests share the module-scoped engine seeded from _populate_test_data, so they run on its loop
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.seed.with_args(_populate_test_data),
+]
+
+
+@pytest.fixture(scope="module")
+def scraper():
+    """Create one scraper for the module; check_price_alerts keeps no state."""
+    scraper = CDONScraper()
+    yield scraper
+    scraper.close()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def save_price(scraper, test_db_session):
+    """Record a new price for a movie and run alert checks, as save_single_movie does."""
+
+    async def _save_price(product_id: str, price: float) -> list[PriceAlert]:
+        result = await test_db_session.execute(
+            select(Movie.id).where(Movie.product_id == product_id)
+        )
+        movie_id = result.scalar_one()
+
+        test_db_session.add(
+            PriceHistory(
+                movie_id=movie_id,
+                product_id=product_id,
+                price=price,
+                checked_at=datetime.now(UTC),
+            )
+        )
+        await scraper.check_price_alerts(test_db_session, movie_id, price)
+        await test_db_session.flush()
+
+        alerts = await test_db_session.execute(
+            select(PriceAlert).where(PriceAlert.movie_id == movie_id)
+        )
+        return list(alerts.scalars().all())
+
+    return _save_price
+
+
+class TestCheckPriceAlerts:
+    """Test the alerts created for a newly saved price."""
+
+    async def test_price_drop_compares_with_latest_earlier_price(self, save_price):
+        """Test that a drop is measured against the most recent earlier price."""
+        alerts = await save_price("drop-1", 15.00)
+
+        assert len(alerts) == 1
+        assert alerts[0].alert_type == "price_drop"
+        assert alerts[0].product_id == "drop-1"
+        assert alerts[0].old_price == 20.00  # Not the older 25.00
+        assert alerts[0].new_price == 15.00
+        assert alerts[0].notified is False
+
+    async def test_price_increase_creates_no_alert(self, save_price):
+        """Test that a price above the previous one creates no alert."""
+        assert await save_price("drop-1", 22.00) == []
+
+    async def test_single_price_row_creates_no_alert(self, save_price):
+        """Test that the first recorded price has nothing to drop from."""
+        assert await save_price("single-1", 9.99) == []
+
+    async def test_watchlist_target_reached(self, save_price):
+        """Test that reaching the watchlist target adds a target alert next to the drop."""
+        alerts = await save_price("watch-1", 24.00)
+
+        by_type = {alert.alert_type: alert for alert in alerts}
+        assert set(by_type) == {"price_drop", "target_reached"}
+        assert by_type["price_drop"].old_price == 30.00
+        assert by_type["target_reached"].old_price == 24.00
+        assert by_type["target_reached"].new_price == 24.00
+
+    async def test_watchlist_target_not_reached(self, save_price):
+        """Test that a drop still above the watchlist target only alerts on the drop."""
+        alerts = await save_price("watch-1", 28.00)
+
+        assert [alert.alert_type for alert in alerts] == ["price_drop"]
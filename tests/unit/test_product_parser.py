@@ -1,33 +1,61 @@
 """Unit tests for ProductParser."""
 
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, PageElement
 
+from src.cdon_watcher import product_parser as product_parser_module
 from src.cdon_watcher.product_parser import ProductParser
 
+# Live product pages parsed by test_parse_product_page_success, one test case each
+_SAMPLE_PRODUCT_URLS = (
+    "https://cdon.fi/tuote/breaking-bad-complete-box-kausi-1-5-blu-ray-e91bc5deded24435/",
+    "https://cdon.fi/tuote/house-of-the-dragon-kausi-2-blu-ray-06077e495a0a59db/",
+    "https://cdon.fi/tuote/indiana-jones-4-movie-collection-blu-ray-5-disc-e5a58c8cee5e590e/",
+)
+
+
+def _html_response(html: str, content_type: str = "text/html; charset=utf-8") -> Mock:
+    """Build a mocked streamed response whose raw body is the given HTML."""
+    response = Mock()
+    response.headers = {"Content-Type": content_type}
+    response.raw.read.return_value = html.encode("utf-8")
+    return response
+
+
+def _year_label(soup: BeautifulSoup) -> PageElement:
+    """Find the first Nauhoitusvuosi label text node, as _extract_production_year does."""
+    label = soup.find(string=product_parser_module._YEAR_LABEL_RX)
+    assert label is not None
+    return label
+
 
 class TestProductParser:
     """Test cases for ProductParser functionality."""
 
+    @pytest.mark.parametrize(
+        "sample_product_url",
+        _SAMPLE_PRODUCT_URLS,
+        ids=lambda url: url.rstrip("/").rsplit("-", 1)[-1],
+    )
     def test_parse_product_page_success(
-        self, product_parser: ProductParser, sample_product_urls: list[str]
+        self, product_parser: ProductParser, sample_product_url: str
     ) -> None:
         """Test successful parsing of product pages."""
-        for url in sample_product_urls:
-            movie = product_parser.parse_product_page(url)
+        movie = product_parser.parse_product_page(sample_product_url)
 
-            assert movie is not None, f"Failed to parse {url}"
-            assert movie.title, "Title should not be empty"
-            assert movie.price > 0, "Price should be greater than 0"
-            assert movie.format, "Format should not be empty"
-            assert movie.url == url, "URL should match input"
+        assert movie is not None, f"Failed to parse {sample_product_url}"
+        assert movie.title, "Title should not be empty"
+        assert movie.price > 0, "Price should be greater than 0"
+        assert movie.format, "Format should not be empty"
+        assert movie.url == sample_product_url, "URL should match input"
 
-            # Check that we don't extract promotional text
-            assert "vihdoin arki" not in movie.title.lower(), (
-                f"Title contains promotional text: {movie.title}"
-            )
+        # Check that we don't extract promotional text
+        assert "vihdoin arki" not in movie.title.lower(), (
+            f"Title contains promotional text: {movie.title}"
+        )
 
     def test_parse_product_page_invalid_url(self, product_parser: ProductParser) -> None:
         """Test parsing with invalid URL."""
@@ -83,10 +111,7 @@ class TestProductParser:
         """
 
         # Mock response
-        mock_response = Mock()
-        mock_response.content = mock_html.encode("utf-8")
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _html_response(mock_html)
 
         # Create parser and test
         parser = ProductParser()
@@ -104,7 +129,32 @@ class TestProductParser:
         assert movie.product_id == "5cb24b79a41d59c4"
 
         # Verify HTTP call was made
-        mock_get.assert_called_once_with(url, timeout=10)
+        mock_get.assert_called_once_with(url, timeout=10, stream=True, headers={})
+
+    @patch("src.cdon_watcher.product_parser.requests.Session.get")
+    def test_parse_product_page_production_year_after_separator_span(self, mock_get: Mock) -> None:
+        """Test CDON's label / ":" span / value markup, with digits in the hashed class names."""
+        mock_html = """
+        <html>
+            <head><title>Batman (4K Ultra HD + Blu-ray) | CDON</title></head>
+            <body>
+                <h1>Batman (4K Ultra HD + Blu-ray)</h1>
+                <h2>13.95 €</h2>
+                <div><span class="sc-f7e20373-0">Nauhoitusvuosi</span><span class="sc-f7e20373-1">:</span>
+                   <span class="sc-f7e20373-2">1989</span></div>
+            </body>
+        </html>
+        """
+
+        mock_get.return_value = _html_response(mock_html)
+
+        parser = ProductParser()
+        movie = parser.parse_product_page(
+            "https://cdon.fi/tuote/batman-4k-ultra-hd-blu-ray-5cb24b79a41d59c4/"
+        )
+
+        assert movie is not None
+        assert movie.production_year == 1989
 
     @patch("src.cdon_watcher.product_parser.requests.Session.get")
     def test_parse_product_page_no_production_year(self, mock_get: Mock) -> None:
@@ -127,10 +177,7 @@ class TestProductParser:
         """
 
         # Mock response
-        mock_response = Mock()
-        mock_response.content = mock_html.encode("utf-8")
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = _html_response(mock_html)
 
         # Create parser and test
         parser = ProductParser()
@@ -144,17 +191,227 @@ class TestProductParser:
         assert movie.price == 19.99
         assert movie.production_year is None  # No year found
 
+    @patch("src.cdon_watcher.product_parser.requests.Session.get")
+    def test_parse_product_page_ignores_top_level_scripts(self, mock_get: Mock) -> None:
+        """Test that prices inside top-level script blobs are not picked up."""
+        mock_html = """
+        <html>
+            <head>
+                <title>Some Movie (Blu-ray) | CDON</title>
+                <script>window.data = {"price": "9.99 €"};</script>
+            </head>
+            <body>
+                <h1>Some Movie (Blu-ray)</h1>
+                <script id="__NEXT_DATA__">{"price": "24.99 €"}</script>
+            </body>
+        </html>
+        """
 
-class TestProductParserPureFunctions:
-    """Test cases for ProductParser pure functions that don't require mocking."""
+        mock_get.return_value = _html_response(mock_html)
 
-    @pytest.fixture
-    def parser(self) -> ProductParser:
-        """Create ProductParser instance for testing pure functions."""
-        return ProductParser()
+        parser = ProductParser()
+        movie = parser.parse_product_page("https://cdon.fi/tuote/some-movie-blu-ray-abc123/")
 
-    @pytest.mark.parametrize(
-        "title,expected",
+        # Script contents never make it into the tree, so there is no price to find
+        assert movie is None
+
+    def test_extract_price_skips_shipping_prices(self, product_parser: ProductParser) -> None:
+        """Test that delivery fees are not mistaken for the product price."""
+        html = """
+        <div class="price-info">
+            <h2>Toimitus 6,90 €</h2>
+            <h2>24,90 €</h2>
+        </div>
+        """
+        soup = BeautifulSoup(html, "lxml")
+        assert product_parser._extract_price(soup) == 24.90
+
+    @patch("src.cdon_watcher.product_parser.requests.Session.get")
+    def test_parse_product_page_prefers_json_ld(self, mock_get: Mock) -> None:
+        """Test that embedded JSON-LD product data supplies title and price."""
+        mock_html = """
+        <html>
+            <head>
+                <script type="application/ld+json">
+                    {"@context": "https://schema.org", "@graph": [
+                        {"@type": "BreadcrumbList"},
+                        {"@type": "Product", "name": "Heat (1995) (Blu-ray)",
+                         "offers": [{"@type": "Offer", "price": "17.95"}]}
+                    ]}
+                </script>
+            </head>
+            <body><h1>Vihdoin arki! Osta nyt</h1></body>
+        </html>
+        """
+        mock_get.return_value = _html_response(mock_html)
+
+        parser = ProductParser()
+        movie = parser.parse_product_page("https://cdon.fi/tuote/heat-1995-blu-ray-abc123/")
+
+        assert movie is not None
+        assert movie.title == "Heat (1995) (Blu-ray)"
+        assert movie.price == 17.95
+        assert movie.format == "Blu-ray"
+
+    @patch("src.cdon_watcher.product_parser.requests.Session.get")
+    def test_parse_product_page_builds_one_tree(self, mock_get: Mock) -> None:
+        """Test that all extractors share a single parsed tree per page."""
+        mock_html = """
+        <h1>Some Movie (Blu-ray)</h1>
+        <h2>19.99 €</h2>
+        <div><p>Nauhoitusvuosi</p><p class="sc-1">2001</p></div>
+        <div class="availability">Varastossa</div>
+        """
+        mock_get.return_value = _html_response(mock_html)
+
+        parser = ProductParser()
+        with patch(
+            "src.cdon_watcher.product_parser.BeautifulSoup", wraps=BeautifulSoup
+        ) as soup_cls:
+            movie = parser.parse_product_page("https://cdon.fi/tuote/some-movie-blu-ray-abc123/")
+
+        assert movie is not None
+        assert movie.production_year == 2001  # Reached the DOM-based year lookup
+        assert movie.availability == "Varastossa"
+        assert soup_cls.call_count == 1
+
+    @patch("src.cdon_watcher.product_parser.requests.Session.get")
+    def test_parse_product_page_skips_non_html(self, mock_get: Mock) -> None:
+        """Test that non-HTML responses are rejected without reading the body."""
+        response = _html_response("<h1>Some Movie (Blu-ray)</h1>", content_type="image/jpeg")
+        mock_get.return_value = response
+
+        parser = ProductParser()
+        movie = parser.parse_product_page("https://cdon.fi/tuote/some-movie-blu-ray-abc123/")
+
+        assert movie is None
+        response.raw.read.assert_not_called()
+        response.close.assert_called_once()
+
+    def test_read_html_truncates_oversized_page(
+        self, product_parser: ProductParser, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a body past the size cap is cut at the cap and logged with its URL."""
+        response = _html_response("<h1>Some Movie (Blu-ray)</h1>" + "x" * 64)
+        url = "https://cdon.fi/tuote/some-movie-blu-ray-abc123/"
+
+        with patch.object(product_parser_module, "_MAX_PAGE_BYTES", 16):
+            content = product_parser._read_html(response, url)
+
+        assert content == b"<h1>Some Movie ("
+        response.raw.read.assert_called_once_with(17, decode_content=True)
+        assert f"truncating: {url}" in caplog.text
+
+    def test_read_html_keeps_page_within_cap(
+        self, product_parser: ProductParser, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a body within the size cap is returned whole without a warning."""
+        response = _html_response("<h1>Some Movie (Blu-ray)</h1>")
+
+        content = product_parser._read_html(response, "https://cdon.fi/tuote/some-movie-abc123/")
+
+        assert content == b"<h1>Some Movie (Blu-ray)</h1>"
+        assert "truncating" not in caplog.text
+
+    @patch("src.cdon_watcher.product_parser.requests.Session.get")
+    def test_parse_product_page_reuses_fresh_cached_page(self, mock_get: Mock) -> None:
+        """Test that a page fetched within the TTL is not requested again."""
+        mock_get.return_value = _html_response("<h1>Some Movie (Blu-ray)</h1><h2>19.99 €</h2>")
+        url = "https://cdon.fi/tuote/some-movie-blu-ray-abc123/"
+
+        parser = ProductParser(cache_ttl=300)
+        first = parser.parse_product_page(url)
+        second = parser.parse_product_page(url)
+
+        assert first == second
+        assert mock_get.call_count == 1
+
+    @patch("src.cdon_watcher.product_parser.requests.Session.get")
+    def test_parse_product_page_does_not_cache_by_default(self, mock_get: Mock) -> None:
+        """Test that without a cache_ttl every parse fetches the live page unconditionally."""
+        mock_get.side_effect = lambda *args, **kwargs: _html_response(
+            "<h1>Some Movie (Blu-ray)</h1><h2>19.99 €</h2>"
+        )
+        url = "https://cdon.fi/tuote/some-movie-blu-ray-abc123/"
+
+        parser = ProductParser()
+        parser.parse_product_page(url)
+        parser.parse_product_page(url)
+
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["headers"] == {}
+        assert not parser._page_cache
+
+    @patch("src.cdon_watcher.product_parser.requests.Session.get")
+    def test_page_cache_is_capped_by_total_bytes(
+        self, mock_get: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that least recently used pages are evicted once the byte cap is exceeded."""
+        page = "<h1>Some Movie (Blu-ray)</h1><h2>19.99 €</h2>"
+        page_size = len(page.encode("utf-8"))
+        monkeypatch.setattr(product_parser_module, "_PAGE_CACHE_MAX_BYTES", 2 * page_size)
+        mock_get.side_effect = lambda *args, **kwargs: _html_response(page)
+        urls = [f"https://cdon.fi/tuote/movie-number-{i}/" for i in range(3)]
+
+        parser = ProductParser(cache_ttl=300)
+        for url in urls:
+            parser.parse_product_page(url)
+
+        assert list(parser._page_cache) == urls[1:]
+        assert parser._page_cache_bytes == 2 * page_size
+
+    @patch("src.cdon_watcher.product_parser.requests.Session.get")
+    def test_parse_product_page_revalidates_stale_page(self, mock_get: Mock) -> None:
+        """Test that a stale page is revalidated and reused on 304 Not Modified."""
+        response = _html_response("<h1>Some Movie (Blu-ray)</h1><h2>19.99 €</h2>")
+        response.headers["ETag"] = '"abc"'
+        not_modified = Mock(status_code=304)
+        mock_get.side_effect = [response, not_modified]
+        url = "https://cdon.fi/tuote/some-movie-blu-ray-abc123/"
+
+        parser = ProductParser(cache_ttl=0)
+        parser.parse_product_page(url)
+        movie = parser.parse_product_page(url)
+
+        assert movie is not None
+        assert movie.price == 19.99
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+        not_modified.raw.read.assert_not_called()
+
+    @patch("src.cdon_watcher.product_parser.requests.Session.get")
+    def test_parse_many_preserves_input_order(self, mock_get: Mock) -> None:
+        """Test that concurrently parsed pages come back in the order they were given."""
+
+        def _page(url: str, **kwargs: Any) -> Mock:
+            title = url.rstrip("/").rsplit("/", 1)[-1].replace("-", " ")
+            return _html_response(f"<h1>{title} Blu-ray</h1><h2>19.99 €</h2>")
+
+        mock_get.side_effect = _page
+        urls = [f"https://cdon.fi/tuote/movie-number-{i}/" for i in range(5)]
+
+        parser = ProductParser()
+        movies = parser.parse_many(urls, max_workers=3)
+
+        assert [movie.url if movie else None for movie in movies] == urls
+        assert mock_get.call_count == len(urls)
+
+    def test_session_pools_and_retries_https(self, product_parser: ProductParser) -> None:
+        """Test that the shared session retries transient server errors over a pool."""
+        adapter = product_parser.session.get_adapter("https://cdon.fi/")
+        retries = adapter.max_retries
+
+        assert retries.total == 3
+        assert retries.connect == 0
+        assert 503 in retries.status_forcelist
+
+
+# Case tables for the pure function tests, built once at import. Explicit ids spare pytest
+# from repr-ing every tuple when collecting.
+
+# (title, expected validity)
+_VALID_TITLE_CASES = [
+    pytest.param(title, expected, id=f"title-{i}")
+    for i, (title, expected) in enumerate(
         [
             # Valid titles
             ("The Matrix Blu-ray Edition", True),
@@ -182,15 +439,15 @@ class TestProductParserPureFunctions:
             ("Movie Title 100% Authentic", True),  # Doesn't end with %, just contains %
             ("Movie Title €19.99", False),  # Contains €
             ("Movie Title OSTA", False),  # Contains "osta"
-        ],
+        ]
     )
-    def test_is_valid_title(self, parser: ProductParser, title: str, expected: bool) -> None:
-        """Test title validation logic."""
-        result = parser._is_valid_title(title)
-        assert result == expected, f"Expected {expected} for title: '{title}'"
+]
 
-    @pytest.mark.parametrize(
-        "price_text,expected",
+
+# (price text, expected price)
+_PRICE_TEXT_CASES = [
+    pytest.param(price_text, expected, id=f"price-{i}")
+    for i, (price_text, expected) in enumerate(
         [
             # Standard price formats
             ("19.99€", 19.99),
@@ -203,6 +460,7 @@ class TestProductParserPureFunctions:
             ("€\xa019.99", 19.99),  # Non-breaking space
             ("29,50 €", 29.50),
             ("  €  15.75  ", 15.75),
+            ("1\xa0299,90 €", 1299.90),  # Non-breaking thousands separator
             # Finnish decimal separator
             ("19,99€", 19.99),
             ("45,90 EUR", 45.90),
@@ -215,17 +473,15 @@ class TestProductParserPureFunctions:
             ("€", None),
             ("EUR", None),
             ("abc€def", None),
-        ],
+        ]
     )
-    def test_extract_price_from_text(
-        self, parser: ProductParser, price_text: str, expected: float | None
-    ) -> None:
-        """Test price extraction from text."""
-        result = parser._extract_price_from_text(price_text)
-        assert result == expected, f"Expected {expected} for text: '{price_text}'"
+]
 
-    @pytest.mark.parametrize(
-        "title,expected_format",
+
+# (title, expected format)
+_FORMAT_CASES = [
+    pytest.param(title, expected_format, id=f"format-{i}")
+    for i, (title, expected_format) in enumerate(
         [
             # 4K Ultra HD detection
             ("The Matrix 4K Ultra HD", "4K Blu-ray"),
@@ -245,15 +501,50 @@ class TestProductParserPureFunctions:
             # Multiple formats (4K takes priority)
             ("Movie 4K Blu-ray", "4K Blu-ray"),
             ("Title UHD Ultra HD Blu-ray", "4K Blu-ray"),
-        ],
+        ]
     )
+]
+
+
+class TestProductParserPureFunctions:
+    """Test cases for ProductParser pure functions that don't require mocking."""
+
+    @pytest.mark.parametrize("title,expected", _VALID_TITLE_CASES)
+    def test_is_valid_title(
+        self, product_parser: ProductParser, title: str, expected: bool
+    ) -> None:
+        """Test title validation logic."""
+        result = product_parser._is_valid_title(title)
+        assert result == expected, f"Expected {expected} for title: '{title}'"
+
+    @pytest.mark.parametrize("price_text,expected", _PRICE_TEXT_CASES)
+    def test_extract_price_from_text(
+        self, product_parser: ProductParser, price_text: str, expected: float | None
+    ) -> None:
+        """Test price extraction from text."""
+        result = product_parser._extract_price_from_text(price_text)
+        assert result == expected, f"Expected {expected} for text: '{price_text}'"
+
+    @pytest.mark.parametrize("title,expected_format", _FORMAT_CASES)
     def test_determine_format(
-        self, parser: ProductParser, title: str, expected_format: str
+        self, product_parser: ProductParser, title: str, expected_format: str
     ) -> None:
         """Test format determination from title."""
-        result = parser._determine_format(title)
+        result = product_parser._determine_format(title)
         assert result == expected_format, f"Expected {expected_format} for title: '{title}'"
 
+    def test_string_helpers_are_memoized_across_instances(
+        self, product_parser: ProductParser
+    ) -> None:
+        """Test that repeated titles are served from the shared module-level cache."""
+        title = "Memoized Movie Title Blu-ray"
+        product_parser._determine_format(title)
+        hits = product_parser_module._determine_format.cache_info().hits
+
+        ProductParser()._determine_format(title)
+
+        assert product_parser_module._determine_format.cache_info().hits == hits + 1
+
     @pytest.mark.parametrize(
         "title,format_str,expected",
         [
@@ -269,10 +560,10 @@ class TestProductParserPureFunctions:
         ],
     )
     def test_is_bluray_format(
-        self, parser: ProductParser, title: str, format_str: str, expected: bool
+        self, product_parser: ProductParser, title: str, format_str: str, expected: bool
     ) -> None:
         """Test Blu-ray format detection."""
-        result = parser.is_bluray_format(title, format_str)
+        result = product_parser.is_bluray_format(title, format_str)
         assert result == expected, (
             f"Expected {expected} for title: '{title}', format: '{format_str}'"
         )
@@ -300,10 +591,10 @@ class TestProductParserPureFunctions:
         ],
     )
     def test_extract_product_id(
-        self, parser: ProductParser, url: str, expected_id: str | None
+        self, product_parser: ProductParser, url: str, expected_id: str | None
     ) -> None:
         """Test product ID extraction from URLs."""
-        result = parser._extract_product_id(url)
+        result = product_parser._extract_product_id(url)
         assert result == expected_id, f"Expected {expected_id} for URL: '{url}'"
 
     @pytest.mark.parametrize(
@@ -328,6 +619,8 @@ class TestProductParserPureFunctions:
             # Invalid formats
             ("123", None),  # 3 digits
             ("12345", None),  # 5 digits
+            ("20245", None),  # 5 digits starting with a valid year
+            ("Kesto 19890 s, 1989", 1989),  # Skips the longer digit run
             ("abc", None),  # Non-numeric
             ("", None),  # Empty
             ("not-a-year", None),  # Text
@@ -339,13 +632,49 @@ class TestProductParserPureFunctions:
         ],
     )
     def test_extract_valid_year(
-        self, parser: ProductParser, text: str, expected_year: int | None
+        self, product_parser: ProductParser, text: str, expected_year: int | None
     ) -> None:
         """Test year extraction and validation from text."""
-        result = parser._extract_valid_year(text)
+        result = product_parser._extract_valid_year(text)
         assert result == expected_year, f"Expected {expected_year} for text: '{text}'"
 
-    def test_extract_year_from_sibling_success(self, parser: ProductParser) -> None:
+    @pytest.mark.parametrize(
+        "title,expected_year",
+        [
+            ("Batman (1989) (4K Ultra HD + Blu-ray)", 1989),
+            ("Dune: Part Two (2024) Blu-ray", 2024),
+            ("Blade Runner 2049 (Blu-ray)", None),  # Year not in parentheses
+            ("Metropolis (1927)", 1927),
+            ("Some Movie (1800)", None),  # Out of range
+            ("Box Set (5 Disc)", None),
+        ],
+    )
+    def test_extract_year_from_title(
+        self, product_parser: ProductParser, title: str, expected_year: int | None
+    ) -> None:
+        """Test extraction of a parenthesized production year from the title."""
+        assert product_parser._extract_year_from_title(title) == expected_year
+
+    @pytest.mark.parametrize(
+        "content,expected_year",
+        [
+            (b'<p class="label">Nauhoitusvuosi</p>\n<p class="value">1989</p>', 1989),
+            (b"<div>nauhoitusvuosi: 2024</div>", 2024),
+            # Digits in hashed class names stop the scan; the DOM methods handle these
+            (b'<p>Nauhoitusvuosi</p><p class="sc-f7e20373-0">1989</p>', None),
+            (b"<p>Nauhoitusvuosi</p><p>Kesto 120 min</p><p>1999</p>", None),
+            (b"<p>Nauhoitusvuosi</p><p>19895</p>", None),
+            (b"<h1>No label here 1989</h1>", None),
+        ],
+    )
+    def test_extract_production_year_from_html(
+        self, product_parser: ProductParser, content: bytes, expected_year: int | None
+    ) -> None:
+        """Test the raw-bytes production year fast path."""
+        result = product_parser._extract_production_year_from_html(content)
+        assert result == expected_year
+
+    def test_year_from_label_sibling_success(self, product_parser: ProductParser) -> None:
         """Test successful year extraction from sibling element."""
         # HTML structure based on actual CDON layout
         html = """
@@ -356,11 +685,11 @@ class TestProductParserPureFunctions:
             </div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_year_from_sibling(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._year_from_label_sibling(_year_label(soup))
         assert result == 1989
 
-    def test_extract_year_from_sibling_case_insensitive(self, parser: ProductParser) -> None:
+    def test_year_from_label_sibling_case_insensitive(self, product_parser: ProductParser) -> None:
         """Test case insensitive matching of Nauhoitusvuosi."""
         html = """
         <div>
@@ -368,11 +697,11 @@ class TestProductParserPureFunctions:
             <p>2024</p>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_year_from_sibling(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._year_from_label_sibling(_year_label(soup))
         assert result == 2024
 
-    def test_extract_year_from_sibling_no_nauhoitusvuosi(self, parser: ProductParser) -> None:
+    def test_year_from_label_sibling_no_nauhoitusvuosi(self, product_parser: ProductParser) -> None:
         """Test when Nauhoitusvuosi label is not found."""
         html = """
         <div>
@@ -380,22 +709,22 @@ class TestProductParserPureFunctions:
             <p>1989</p>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_year_from_sibling(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._extract_production_year(soup)
         assert result is None
 
-    def test_extract_year_from_sibling_no_next_sibling(self, parser: ProductParser) -> None:
+    def test_year_from_label_sibling_no_next_sibling(self, product_parser: ProductParser) -> None:
         """Test when Nauhoitusvuosi has no next sibling."""
         html = """
         <div>
             <p>Nauhoitusvuosi</p>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_year_from_sibling(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._year_from_label_sibling(_year_label(soup))
         assert result is None
 
-    def test_extract_year_from_sibling_wrong_sibling_tag(self, parser: ProductParser) -> None:
+    def test_year_from_label_sibling_wrong_sibling_tag(self, product_parser: ProductParser) -> None:
         """Test when next sibling is not a p tag."""
         html = """
         <div>
@@ -403,11 +732,13 @@ class TestProductParserPureFunctions:
             <div>1989</div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_year_from_sibling(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._year_from_label_sibling(_year_label(soup))
         assert result is None
 
-    def test_extract_year_from_sibling_invalid_year_in_sibling(self, parser: ProductParser) -> None:
+    def test_year_from_label_sibling_invalid_year_in_sibling(
+        self, product_parser: ProductParser
+    ) -> None:
         """Test when sibling contains invalid year."""
         html = """
         <div>
@@ -415,11 +746,11 @@ class TestProductParserPureFunctions:
             <p>Not a year</p>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_year_from_sibling(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._year_from_label_sibling(_year_label(soup))
         assert result is None
 
-    def test_extract_year_from_sibling_parent_not_p_tag(self, parser: ProductParser) -> None:
+    def test_year_from_label_sibling_parent_not_p_tag(self, product_parser: ProductParser) -> None:
         """Test when Nauhoitusvuosi parent is not a p tag."""
         html = """
         <div>
@@ -427,11 +758,13 @@ class TestProductParserPureFunctions:
             <p>1989</p>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_year_from_sibling(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._year_from_label_sibling(_year_label(soup))
         assert result is None
 
-    def test_extract_year_from_container_success(self, parser: ProductParser) -> None:
+    def test_extract_production_year_label_text_success(
+        self, product_parser: ProductParser
+    ) -> None:
         """Test successful year extraction from container div."""
         html = """
         <div class="product-info">
@@ -440,22 +773,26 @@ class TestProductParserPureFunctions:
             </div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_year_from_container(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._extract_production_year(soup)
         assert result == 1989
 
-    def test_extract_year_from_container_case_insensitive(self, parser: ProductParser) -> None:
+    def test_extract_production_year_label_text_case_insensitive(
+        self, product_parser: ProductParser
+    ) -> None:
         """Test case insensitive matching in container."""
         html = """
         <div>
             <div>nauhoitusvuosi 2024</div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_year_from_container(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._extract_production_year(soup)
         assert result == 2024
 
-    def test_extract_year_from_container_multiple_divs(self, parser: ProductParser) -> None:
+    def test_extract_production_year_label_text_multiple_divs(
+        self, product_parser: ProductParser
+    ) -> None:
         """Test extraction when multiple divs exist."""
         html = """
         <div>
@@ -465,11 +802,13 @@ class TestProductParserPureFunctions:
             <div>Format: Blu-ray</div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_year_from_container(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._extract_production_year(soup)
         assert result == 1982
 
-    def test_extract_year_from_container_no_nauhoitusvuosi(self, parser: ProductParser) -> None:
+    def test_extract_production_year_label_text_no_nauhoitusvuosi(
+        self, product_parser: ProductParser
+    ) -> None:
         """Test when no div contains Nauhoitusvuosi."""
         html = """
         <div>
@@ -478,33 +817,39 @@ class TestProductParserPureFunctions:
             <div>Price: €19.99</div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_year_from_container(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._extract_production_year(soup)
         assert result is None
 
-    def test_extract_year_from_container_no_valid_year(self, parser: ProductParser) -> None:
+    def test_extract_production_year_label_text_no_valid_year(
+        self, product_parser: ProductParser
+    ) -> None:
         """Test when div has Nauhoitusvuosi but no valid year."""
         html = """
         <div>
             <div>Nauhoitusvuosi: Unknown</div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_year_from_container(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._extract_production_year(soup)
         assert result is None
 
-    def test_extract_year_from_container_invalid_year_range(self, parser: ProductParser) -> None:
+    def test_extract_production_year_label_text_invalid_year_range(
+        self, product_parser: ProductParser
+    ) -> None:
         """Test when div has Nauhoitusvuosi with invalid year range."""
         html = """
         <div>
             <div>Nauhoitusvuosi: 1800</div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_year_from_container(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._extract_production_year(soup)
         assert result is None
 
-    def test_extract_year_from_container_first_match(self, parser: ProductParser) -> None:
+    def test_extract_production_year_label_text_first_match(
+        self, product_parser: ProductParser
+    ) -> None:
         """Test that first matching div with valid year is returned."""
         html = """
         <div>
@@ -512,11 +857,27 @@ class TestProductParserPureFunctions:
             <div>Also has Nauhoitusvuosi 2000</div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_year_from_container(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._extract_production_year(soup)
         assert result == 1995
 
-    def test_extract_production_year_sibling_method_success(self, parser: ProductParser) -> None:
+    def test_extract_production_year_label_text_ignores_year_before_label(
+        self, product_parser: ProductParser
+    ) -> None:
+        """Test that only a year following the Nauhoitusvuosi label is returned."""
+        html = """
+        <div>
+            <div>Julkaistu 2019</div>
+            <div>Nauhoitusvuosi: 1984</div>
+        </div>
+        """
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._extract_production_year(soup)
+        assert result == 1984
+
+    def test_extract_production_year_sibling_method_success(
+        self, product_parser: ProductParser
+    ) -> None:
         """Test successful production year extraction via sibling method."""
         # HTML structure similar to actual Batman CDON page
         html = """
@@ -527,12 +888,12 @@ class TestProductParserPureFunctions:
             </div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_production_year(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._extract_production_year(soup)
         assert result == 1989
 
     def test_extract_production_year_container_fallback_success(
-        self, parser: ProductParser
+        self, product_parser: ProductParser
     ) -> None:
         """Test production year extraction via container fallback method."""
         html = """
@@ -545,11 +906,11 @@ class TestProductParserPureFunctions:
             </div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_production_year(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._extract_production_year(soup)
         assert result == 2024
 
-    def test_extract_production_year_no_year_found(self, parser: ProductParser) -> None:
+    def test_extract_production_year_no_year_found(self, product_parser: ProductParser) -> None:
         """Test when no production year is found by any method."""
         html = """
         <div>
@@ -558,12 +919,12 @@ class TestProductParserPureFunctions:
             <div>Price: €19.99</div>
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_production_year(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._extract_production_year(soup)
         assert result is None
 
     def test_extract_production_year_sibling_fails_container_succeeds(
-        self, parser: ProductParser
+        self, product_parser: ProductParser
     ) -> None:
         """Test fallback to container method when sibling method fails."""
         html = """
@@ -573,21 +934,34 @@ class TestProductParserPureFunctions:
             <div>Movie info Nauhoitusvuosi 1995</div>  <!-- Container method succeeds -->
         </div>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = parser._extract_production_year(soup)
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._extract_production_year(soup)
         assert result == 1995
 
-    def test_extract_production_year_error_handling(self, parser: ProductParser) -> None:
+    def test_extract_production_year_year_in_next_text_node(
+        self, product_parser: ProductParser
+    ) -> None:
+        """Test a year printed in the text node right after an inline label."""
+        html = """
+        <div>
+            <div><b>Nauhoitusvuosi</b> 2001</div>
+        </div>
+        """
+        soup = BeautifulSoup(html, "lxml")
+        result = product_parser._extract_production_year(soup)
+        assert result == 2001
+
+    def test_extract_production_year_error_handling(self, product_parser: ProductParser) -> None:
         """Test error handling in production year extraction."""
         # Create malformed soup that could cause errors
         html = "<invalid><broken>Nauhoitusvuosi</broken>"
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         # Should not raise exception, should return None
-        result = parser._extract_production_year(soup)
+        result = product_parser._extract_production_year(soup)
         assert result is None
 
-    def test_extract_production_year_empty_soup(self, parser: ProductParser) -> None:
+    def test_extract_production_year_empty_soup(self, product_parser: ProductParser) -> None:
         """Test with empty BeautifulSoup object."""
-        soup = BeautifulSoup("", "html.parser")
-        result = parser._extract_production_year(soup)
+        soup = BeautifulSoup("", "lxml")
+        result = product_parser._extract_production_year(soup)
         assert result is None
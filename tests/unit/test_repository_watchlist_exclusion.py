@@ -1,150 +1,86 @@
 """Unit tests for watchlist exclusion in cheapest Blu-ray queries."""
 
-import tempfile
 from datetime import UTC, datetime
-from pathlib import Path
 
 import pytest
+from sqlmodel import insert
 
 from src.cdon_watcher.database.repository import DatabaseRepository
 from src.cdon_watcher.models import Movie, PriceHistory, Watchlist
 
+# (product_id, title, format, price) for every seeded movie
+_TEST_MOVIES: tuple[tuple[str, str, str, float], ...] = (
+    # Regular Blu-rays
+    ("movie-1", "Test Movie 1", "Blu-ray", 10.99),
+    ("movie-2", "Test Movie 2", "Blu-ray", 15.99),
+    # 4K Blu-rays
+    ("movie-3", "Test Movie 3", "4K Blu-ray", 25.99),
+    ("movie-4", "Test Movie 4", "4K Blu-ray", 20.99),
+)
 
-@pytest.fixture
-def temp_db_path():
-    """Provide a temporary database path for tests."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp_file:
-        temp_path = tmp_file.name
+# movie-1 and movie-3 are watchlisted (one regular Blu-ray, one 4K)
+_WATCHLIST_TARGETS: tuple[tuple[str, float], ...] = (
+    ("movie-1", 8.99),
+    ("movie-3", 20.00),
+)
 
-    yield temp_path
 
-    # Clean up
-    temp_file_path = Path(temp_path)
-    if temp_file_path.exists():
-        temp_file_path.unlink()
-
-
-@pytest.fixture
-async def test_db_session(temp_db_path, monkeypatch):
-    """Create test database session with schema and test data."""
-    # Mock config to use our test database
-    from src.cdon_watcher.config import CONFIG
-
-    monkeypatch.setitem(CONFIG, "db_path", temp_db_path)
-
-    # Create a new engine and session factory for our isolated test database
-    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-    from sqlmodel import SQLModel
+def _populate_test_data(session):
+    """Populate database with test data for watchlist exclusion tests."""
+    now = datetime.now(UTC)
 
-    engine = create_async_engine(
-        f"sqlite+aiosqlite:///{temp_db_path}",
-        echo=False,
-        future=True,
+    # Bulk insert test movies, returning their auto-generated IDs
+    result = session.execute(
+        insert(Movie).returning(Movie.product_id, Movie.id),
+        [
+            {
+                "product_id": product_id,
+                "title": title,
+                "format": movie_format,
+                "url": f"https://cdon.fi/{product_id}",
+                "first_seen": now,
+                "last_updated": now,
+            }
+            for product_id, title, movie_format, _ in _TEST_MOVIES
+        ],
     )
+    movie_ids = dict(result.tuples().all())
 
-    # Initialize database schema
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
-
-    # Create session factory for our test engine
-    test_session_local = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
+    # Create price history for all movies
+    session.execute(
+        insert(PriceHistory),
+        [
+            {
+                "movie_id": movie_ids[product_id],
+                "product_id": product_id,
+                "price": price,
+                "checked_at": now,
+            }
+            for product_id, _, _, price in _TEST_MOVIES
+        ],
     )
 
-    # Create session for tests
-    async with test_session_local() as session:
-        # Add test data
-        await _populate_test_data(session)
-        yield session
-
-    await engine.dispose()
-
+    session.execute(
+        insert(Watchlist),
+        [
+            {
+                "movie_id": movie_ids[product_id],
+                "product_id": product_id,
+                "target_price": target_price,
+                "created_at": now,
+            }
+            for product_id, target_price in _WATCHLIST_TARGETS
+        ],
+    )
 
-async def _populate_test_data(session):
-    """Populate database with test data for watchlist exclusion tests."""
-    now = datetime.now(UTC)
+    session.commit()
 
-    # Create test movies
-    movies = [
-        Movie(
-            product_id="movie-1",
-            title="Test Movie 1",
-            format="Blu-ray",
-            url="https://cdon.fi/movie-1",
-            first_seen=now,
-            last_updated=now,
-        ),
-        Movie(
-            product_id="movie-2",
-            title="Test Movie 2",
-            format="Blu-ray",
-            url="https://cdon.fi/movie-2",
-            first_seen=now,
-            last_updated=now,
-        ),
-        Movie(
-            product_id="movie-3",
-            title="Test Movie 3",
-            format="4K Blu-ray",
-            url="https://cdon.fi/movie-3",
-            first_seen=now,
-            last_updated=now,
-        ),
-        Movie(
-            product_id="movie-4",
-            title="Test Movie 4",
-            format="4K Blu-ray",
-            url="https://cdon.fi/movie-4",
-            first_seen=now,
-            last_updated=now,
-        ),
-    ]
-
-    for movie in movies:
-        session.add(movie)
-
-    # Commit movies first to get their IDs
-    await session.commit()
-
-    # Refresh to get the auto-generated IDs
-    for movie in movies:
-        await session.refresh(movie)
 
-    # Create price history for all movies
-    price_history = [
-        # Regular Blu-rays
-        PriceHistory(movie_id=movies[0].id, product_id="movie-1", price=10.99, checked_at=now),
-        PriceHistory(movie_id=movies[1].id, product_id="movie-2", price=15.99, checked_at=now),
-        # 4K Blu-rays
-        PriceHistory(movie_id=movies[2].id, product_id="movie-3", price=25.99, checked_at=now),
-        PriceHistory(movie_id=movies[3].id, product_id="movie-4", price=20.99, checked_at=now),
-    ]
-
-    for price in price_history:
-        session.add(price)
-
-    # Add movie-1 and movie-3 to watchlist (one regular Blu-ray, one 4K)
-    watchlist = [
-        Watchlist(
-            movie_id=movies[0].id,  # movie-1
-            product_id="movie-1",
-            target_price=8.99,
-            created_at=now,
-        ),
-        Watchlist(
-            movie_id=movies[2].id,  # movie-3
-            product_id="movie-3",
-            target_price=20.00,
-            created_at=now,
-        ),
-    ]
-
-    for item in watchlist:
-        session.add(item)
-
-    await session.commit()
+# Tests share the module-scoped engine seeded from _populate_test_data, so they run on its loop
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.seed.with_args(_populate_test_data),
+]
 
 
 class TestWatchlistExclusion:
@@ -206,36 +142,15 @@ class TestWatchlistExclusion:
         """Test that lists return empty when all movies are watchlisted."""
         repo = DatabaseRepository(test_db_session)
 
-        # Get all movies to find the IDs we need
-        from sqlmodel import select
-
-        result = await test_db_session.execute(select(Movie))
-        all_movies = result.scalars().all()
-
-        # Find movie-2 and movie-4 by product_id
-        movie_2 = next(m for m in all_movies if m.product_id == "movie-2")
-        movie_4 = next(m for m in all_movies if m.product_id == "movie-4")
-
         # Add remaining movies to watchlist
-        now = datetime.now(UTC)
-        additional_watchlist = [
-            Watchlist(
-                movie_id=movie_2.id,
-                product_id="movie-2",
-                target_price=12.99,
-                created_at=now,
-            ),
-            Watchlist(
-                movie_id=movie_4.id,
-                product_id="movie-4",
-                target_price=18.99,
-                created_at=now,
-            ),
-        ]
-
-        for item in additional_watchlist:
-            test_db_session.add(item)
-        await test_db_session.commit()
+        assert await repo.add_to_watchlist("movie-2", 12.99)
+        assert await repo.add_to_watchlist("movie-4", 18.99)
+
+        # Each movie is found by a direct product_id lookup
+        movie_2 = await repo.get_watchlist_item("movie-2")
+        movie_4 = await repo.get_watchlist_item("movie-4")
+        assert movie_2 is not None and movie_2.target_price == 12.99
+        assert movie_4 is not None and movie_4.target_price == 18.99
 
         # Both lists should be empty
         bluray_movies = await repo.get_cheapest_blurays(limit=10)
@@ -243,3 +158,37 @@ class TestWatchlistExclusion:
 
         fourk_movies = await repo.get_cheapest_4k_blurays(limit=10)
         assert len(fourk_movies) == 0
+
+
+class TestWatchlistItemLookup:
+    """Test direct watchlist lookups by product_id."""
+
+    async def test_get_watchlist_item_returns_item(self, test_db_session):
+        """Test that a watchlisted movie is returned with its pricing."""
+        repo = DatabaseRepository(test_db_session)
+
+        item = await repo.get_watchlist_item("movie-3")
+
+        assert item is not None
+        assert item.product_id == "movie-3"
+        assert item.title == "Test Movie 3"
+        assert item.target_price == 20.00
+        assert item.current_price == 25.99
+
+    async def test_get_watchlist_item_not_watchlisted(self, test_db_session):
+        """Test that movies outside the watchlist return None."""
+        repo = DatabaseRepository(test_db_session)
+
+        assert await repo.get_watchlist_item("movie-2") is None
+        assert await repo.get_watchlist_item("nonexistent") is None
+
+    async def test_add_to_watchlist_duplicate_updates_target(self, test_db_session):
+        """Test that re-adding a watchlisted movie updates its target price."""
+        repo = DatabaseRepository(test_db_session)
+
+        assert await repo.add_to_watchlist("movie-1", 7.50)
+
+        item = await repo.get_watchlist_item("movie-1")
+        assert item is not None
+        assert item.target_price == 7.50
+        assert len(await repo.get_watchlist()) == 2
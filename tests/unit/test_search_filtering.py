@@ -1,135 +1,73 @@
 """Unit tests for search filtering functionality."""
 
-import tempfile
 from datetime import UTC, datetime
-from pathlib import Path
 
 import pytest
+import pytest_asyncio
+from sqlmodel import insert, select
 
 from src.cdon_watcher.database.repository import DatabaseRepository
 from src.cdon_watcher.models import Movie, PriceHistory
 
+# (product_id, title, format, price) for every seeded movie
+_TEST_MOVIES: tuple[tuple[str, str, str, float], ...] = (
+    ("test-bluray-1", "Test Bluray Movie 1", "Blu-ray", 15.99),
+    ("test-bluray-2", "Another Bluray Film", "Blu-ray", 25.50),
+    ("test-4k-1", "Test 4K Movie", "4K Ultra HD Blu-ray", 35.99),
+    ("test-4k-2", "Another 4K Film", "4K Blu-ray", 19.99),
+    ("test-dvd-1", "Test DVD Movie", "DVD", 9.99),
+)
 
-@pytest.fixture
-def temp_db_path():
-    """Provide a temporary database path for tests."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp_file:
-        temp_path = tmp_file.name
 
-    yield temp_path
+def _populate_test_data(session):
+    """Populate database with movies of different formats and prices."""
+    now = datetime.now(UTC)
 
-    # Clean up
-    temp_file_path = Path(temp_path)
-    if temp_file_path.exists():
-        temp_file_path.unlink()
-
-
-@pytest.fixture
-async def test_db_session(temp_db_path, monkeypatch):
-    """Create test database session with schema and test data."""
-    # Mock config to use our test database
-    from src.cdon_watcher.config import CONFIG
-
-    monkeypatch.setitem(CONFIG, "db_path", temp_db_path)
-
-    # Create a new engine and session factory for our isolated test database
-    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-    from sqlmodel import SQLModel
-
-    engine = create_async_engine(
-        f"sqlite+aiosqlite:///{temp_db_path}",
-        echo=False,
-        future=True,
-    )
-
-    # Initialize database schema
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
-
-    # Create session factory for our test engine
-    test_session_local = async_sessionmaker(
-        bind=engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
+    # Bulk insert the movies, returning their auto-generated IDs
+    result = session.execute(
+        insert(Movie).returning(Movie.product_id, Movie.id),
+        [
+            {
+                "product_id": product_id,
+                "title": title,
+                "format": movie_format,
+                "url": f"https://example.com/{product_id}",
+                "first_seen": now,
+                "last_updated": now,
+            }
+            for product_id, title, movie_format, _ in _TEST_MOVIES
+        ],
     )
+    movie_ids = dict(result.tuples().all())
 
-    async with test_session_local() as session:
-        # Add test movies with different formats and prices
-        movies_data = [
-            {
-                "product_id": "test-bluray-1",
-                "title": "Test Bluray Movie 1",
-                "format": "Blu-ray",
-                "price": 15.99,
-            },
-            {
-                "product_id": "test-bluray-2",
-                "title": "Another Bluray Film",
-                "format": "Blu-ray",
-                "price": 25.50,
-            },
-            {
-                "product_id": "test-4k-1",
-                "title": "Test 4K Movie",
-                "format": "4K Ultra HD Blu-ray",
-                "price": 35.99,
-            },
+    # Add price history for each movie
+    session.execute(
+        insert(PriceHistory),
+        [
             {
-                "product_id": "test-4k-2",
-                "title": "Another 4K Film",
-                "format": "4K Blu-ray",
-                "price": 19.99,
-            },
-            {
-                "product_id": "test-dvd-1",
-                "title": "Test DVD Movie",
-                "format": "DVD",
-                "price": 9.99,
-            },
-        ]
-
-        for movie_data in movies_data:
-            movie = Movie(
-                product_id=movie_data["product_id"],
-                title=movie_data["title"],
-                format=movie_data["format"],
-                url=f"https://example.com/{movie_data['product_id']}",
-                first_seen=datetime.now(UTC),
-                last_updated=datetime.now(UTC),
-            )
-            session.add(movie)
-
-        await session.commit()
-
-        # Add price history for each movie
-        for movie_data in movies_data:
-            # Get the movie we just created
-            from sqlmodel import select
-
-            result = await session.execute(
-                select(Movie).where(Movie.product_id == movie_data["product_id"])
-            )
-            movie = result.scalar_one()
+                "movie_id": movie_ids[product_id],
+                "product_id": product_id,
+                "price": price,
+                "checked_at": now,
+            }
+            for product_id, _, _, price in _TEST_MOVIES
+        ],
+    )
 
-            price_history = PriceHistory(
-                movie_id=movie.id,
-                product_id=movie_data["product_id"],
-                price=movie_data["price"],
-                checked_at=datetime.now(UTC),
-            )
-            session.add(price_history)
+    session.commit()
 
-        await session.commit()
-        yield session
 
-    # Clean up
-    await engine.dispose()
+# Tests share the module-scoped engine seeded from _populate_test_data, so they run on its loop
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="module"),
+    pytest.mark.seed.with_args(_populate_test_data),
+]
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="module")
 async def test_repository(test_db_session):
     """Create a test repository instance."""
-    return DatabaseRepository(test_db_session, enable_query_logging=True)
+    return DatabaseRepository(test_db_session)
 
 
 class TestSearchFiltering:
@@ -200,6 +138,46 @@ class TestSearchFiltering:
         assert results[0].current_price == 19.99  # 4K film (cheaper)
         assert results[1].current_price == 25.50  # Blu-ray film (more expensive)
 
+    async def test_search_all_movies_ordered_by_price(self, test_repository, test_db_session):
+        """Test that a filter-only search returns every movie in SQL price order."""
+        results = await test_repository.search_movies("", max_price=100.0)
+
+        # Let SQLite produce the expected order rather than re-sorting in Python
+        expected = await test_db_session.execute(
+            select(PriceHistory.product_id).order_by(PriceHistory.price)
+        )
+        assert [movie.product_id for movie in results] == expected.scalars().all()
+
+    async def test_search_is_case_insensitive(self, test_repository):
+        """Test that title search ignores case."""
+        results = await test_repository.search_movies("another BLURAY")
+
+        assert [movie.title for movie in results] == ["Another Bluray Film"]
+
+    async def test_search_folds_non_ascii_case(self, test_repository, test_db_session):
+        """Test that title search also ignores the case of non-ASCII letters."""
+        now = datetime.now(UTC)
+        movie = Movie(
+            product_id="test-bluray-fi",
+            title="Äänten Yö",
+            format="Blu-ray",
+            url="https://example.com/test-bluray-fi",
+            first_seen=now,
+            last_updated=now,
+        )
+        test_db_session.add(movie)
+        await test_db_session.flush()
+        test_db_session.add(
+            PriceHistory(
+                movie_id=movie.id, product_id="test-bluray-fi", price=45.00, checked_at=now
+            )
+        )
+        await test_db_session.flush()
+
+        results = await test_repository.search_movies("ÄÄNTEN yÖ")
+
+        assert [movie.title for movie in results] == ["Äänten Yö"]
+
     async def test_search_empty_results(self, test_repository):
         """Test search that returns no results."""
         results = await test_repository.search_movies("NonexistentMovie")
@@ -1,85 +1,137 @@
 """Unit tests for TMDBService title cleaning functionality."""
 
+import re
+
 import pytest
 
+from cdon_watcher import tmdb_service as tmdb_service_module
 from cdon_watcher.tmdb_service import TMDBService
 
 
-class TestTMDBService:
-    """Test TMDB service functionality."""
-
-    @pytest.fixture
-    def tmdb_service(self):
-        """Create TMDBService instance for testing (no API key needed for title cleaning)."""
-        return TMDBService(api_key="test_key", poster_dir="./test_posters")
+@pytest.fixture(scope="module")
+def tmdb_service(tmp_path_factory: pytest.TempPathFactory) -> TMDBService:
+    """Create one TMDBService for the module (no API key needed for the pure helpers)."""
+    return TMDBService(api_key="test_key", poster_dir=str(tmp_path_factory.mktemp("posters")))
+
+
+# Movie title cleaning cases (is_tv=False), grouped so failures keep a readable id
+_CLEAN_CASES_MOVIE = [
+    pytest.param(input_title, expected_output, id=f"{group}-{i}")
+    for group, cases in (
+        (
+            "basic",
+            [
+                # Basic Blu-ray/DVD indicator removal
+                ("The Matrix Blu-ray", "The Matrix"),
+                ("Inception DVD", "Inception"),
+                ("Dune 4K", "Dune"),
+                ("Blade Runner UHD", "Blade Runner"),
+                ("Lord of the Rings Ultimate Edition", "Lord of the Rings"),
+                ("Alien Collector's Edition", "Alien"),
+                ("Star Wars Special Edition", "Star Wars"),
+                ("Gladiator Extended Cut", "Gladiator"),
+                ("The Godfather Director's Cut", "The Godfather"),
+                # Case insensitive
+                ("The Matrix blu-ray", "The Matrix"),
+                ("Inception dvd", "Inception"),
+                # Multiple indicators
+                ("The Dark Knight Blu-ray Ultimate Edition", "The Dark Knight"),
+                ("Avatar Extended Director's Cut", "Avatar"),
+            ],
+        ),
+        # Disc count and import information removal
+        (
+            "disc-import",
+            [
+                # Disc count removal
+                ("The Matrix (2 disc)", "The Matrix"),
+                ("Lord of the Rings (3 disc)", "Lord of the Rings"),
+                ("Star Wars (1 disc)", "Star Wars"),
+                # Import information
+                ("Akira (Import)", "Akira"),
+                ("Ghost in the Shell (import)", "Ghost in the Shell"),
+                # Combined
+                ("Blade Runner (2 disc) (Import)", "Blade Runner"),
+            ],
+        ),
+        (
+            "year",
+            [
+                # Year removal
+                ("The Matrix (1999)", "The Matrix"),
+                ("Blade Runner (1982)", "Blade Runner"),
+                ("Inception (2010)", "Inception"),
+                # No year
+                ("The Matrix", "The Matrix"),
+            ],
+        ),
+        # Punctuation normalization and whitespace handling
+        (
+            "punctuation",
+            [
+                # Colon replacement
+                ("Star Wars: Episode IV", "Star Wars Episode IV"),
+                ("Lord of the Rings: Fellowship", "Lord of the Rings Fellowship"),
+                # Dash normalization
+                ("Spider-Man", "Spider Man"),
+                ("X-Men", "X Men"),
+                # Multiple punctuation
+                (
+                    "Pirates of the Caribbean: Dead Man's Chest",
+                    "Pirates of the Caribbean Dead Man's Chest",
+                ),
+                # Extra whitespace
+                ("The   Matrix    ", "The Matrix"),
+                ("  Blade  Runner  ", "Blade Runner"),
+            ],
+        ),
+        # Edge cases and complex cleaning scenarios
+        (
+            "edge",
+            [
+                # Empty string
+                ("", ""),
+                # Only punctuation
+                ("---", ""),
+                (":::", ""),
+                # Only cleaning indicators
+                ("Blu-ray DVD 4K", ""),
+                ("(2 disc) (Import)", ""),
+                # Complex real-world examples
+                (
+                    "The Dark Knight Blu-ray Ultimate Collector's Edition (2 disc) (2008)",
+                    "The Dark Knight",
+                ),
+                (
+                    "Star Wars: Episode IV - A New Hope 4K UHD (1977)",
+                    "Star Wars Episode IV A New Hope",
+                ),
+                # Real database examples (now properly cleaned)
+                (
+                    "2001: A Space Odyssey - The Film Vault Limited Edition (4K Ultra + Blu-ray)",
+                    "2001 A Space Odyssey The Film Vault Limited",
+                ),
+                ("(95)The Toxic Avenger 1-4 Collection (Blu-ray)", "(95)The Toxic Avenger 1 4"),
+                (
+                    "Avatar: The Way of Water (3D Blu-ray + Blu-ray) (4 disc) (Import)",
+                    "Avatar The Way of Water",
+                ),
+                ("Bad boys 1-4 (4 Blu-ray)", "Bad boys 1 4"),
+                # Note: Akame Ga Kill moved to TV test section since it's detected as TV
+                ("Dune: Part One & Two (Blu-ray)", "Dune Part One & Two"),
+            ],
+        ),
+    )
+    for i, (input_title, expected_output) in enumerate(cases)
+]
 
 
 class TestTitleCleaning:
     """Test title cleaning functionality."""
 
-    @pytest.fixture
-    def tmdb_service(self):
-        """Create TMDBService instance for testing."""
-        return TMDBService(api_key="test_key", poster_dir="./test_posters")
-
-    @pytest.mark.parametrize(
-        "input_title,expected_output",
-        [
-            # Basic Blu-ray/DVD indicator removal
-            ("The Matrix Blu-ray", "The Matrix"),
-            ("Inception DVD", "Inception"),
-            ("Dune 4K", "Dune"),
-            ("Blade Runner UHD", "Blade Runner"),
-            ("Lord of the Rings Ultimate Edition", "Lord of the Rings"),
-            ("Alien Collector's Edition", "Alien"),
-            ("Star Wars Special Edition", "Star Wars"),
-            ("Gladiator Extended Cut", "Gladiator"),
-            ("The Godfather Director's Cut", "The Godfather"),
-            # Case insensitive
-            ("The Matrix blu-ray", "The Matrix"),
-            ("Inception dvd", "Inception"),
-            # Multiple indicators
-            ("The Dark Knight Blu-ray Ultimate Edition", "The Dark Knight"),
-            ("Avatar Extended Director's Cut", "Avatar"),
-        ],
-    )
-    def test_basic_title_cleaning_movies(self, tmdb_service, input_title, expected_output):
-        """Test basic title cleaning for movie titles."""
-        result = tmdb_service._clean_title_for_search(input_title, is_tv=False)
-        assert result == expected_output
-
-    @pytest.mark.parametrize(
-        "input_title,expected_output",
-        [
-            # Disc count removal
-            ("The Matrix (2 disc)", "The Matrix"),
-            ("Lord of the Rings (3 disc)", "Lord of the Rings"),
-            ("Star Wars (1 disc)", "Star Wars"),
-            # Import information
-            ("Akira (Import)", "Akira"),
-            ("Ghost in the Shell (import)", "Ghost in the Shell"),
-            # Combined
-            ("Blade Runner (2 disc) (Import)", "Blade Runner"),
-        ],
-    )
-    def test_disc_and_import_removal(self, tmdb_service, input_title, expected_output):
-        """Test removal of disc count and import information."""
-        result = tmdb_service._clean_title_for_search(input_title, is_tv=False)
-        assert result == expected_output
-
-    @pytest.mark.parametrize(
-        "input_title,expected_output",
-        [
-            # Year removal
-            ("The Matrix (1999)", "The Matrix"),
-            ("Blade Runner (1982)", "Blade Runner"),
-            ("Inception (2010)", "Inception"),
-            # No year
-            ("The Matrix", "The Matrix"),
-        ],
-    )
-    def test_year_removal(self, tmdb_service, input_title, expected_output):
-        """Test removal of year information from titles."""
+    @pytest.mark.parametrize("input_title,expected_output", _CLEAN_CASES_MOVIE)
+    def test_clean_title_movies(self, tmdb_service, input_title, expected_output):
+        """Test title cleaning for movie titles."""
         result = tmdb_service._clean_title_for_search(input_title, is_tv=False)
         assert result == expected_output
 
@@ -120,76 +172,31 @@ class TestTitleCleaning:
         result = tmdb_service._clean_title_for_search(input_title, is_tv=True)
         assert result == expected_output
 
-    @pytest.mark.parametrize(
-        "input_title,expected_output",
-        [
-            # Colon replacement
-            ("Star Wars: Episode IV", "Star Wars Episode IV"),
-            ("Lord of the Rings: Fellowship", "Lord of the Rings Fellowship"),
-            # Dash normalization
-            ("Spider-Man", "Spider Man"),
-            ("X-Men", "X Men"),
-            # Multiple punctuation
-            (
-                "Pirates of the Caribbean: Dead Man's Chest",
-                "Pirates of the Caribbean Dead Man's Chest",
-            ),
-            # Extra whitespace
-            ("The   Matrix    ", "The Matrix"),
-            ("  Blade  Runner  ", "Blade Runner"),
-        ],
-    )
-    def test_punctuation_normalization(self, tmdb_service, input_title, expected_output):
-        """Test punctuation normalization and whitespace handling."""
-        result = tmdb_service._clean_title_for_search(input_title, is_tv=False)
-        assert result == expected_output
+    def test_clean_title_is_memoized(self, tmdb_service):
+        """Test that repeated titles are served from the module-level cache."""
+        title = "Memoized Movie Title Blu-ray (2 disc)"
+        tmdb_service._clean_title_for_search(title)
+        hits = tmdb_service_module._clean_title_for_search.cache_info().hits
 
-    @pytest.mark.parametrize(
-        "input_title,expected_output",
-        [
-            # Empty string
-            ("", ""),
-            # Only punctuation
-            ("---", ""),
-            (":::", ""),
-            # Only cleaning indicators
-            ("Blu-ray DVD 4K", ""),
-            ("(2 disc) (Import)", ""),
-            # Complex real-world examples
-            (
-                "The Dark Knight Blu-ray Ultimate Collector's Edition (2 disc) (2008)",
-                "The Dark Knight",
-            ),
-            ("Star Wars: Episode IV - A New Hope 4K UHD (1977)", "Star Wars Episode IV A New Hope"),
-            # Real database examples (now properly cleaned)
-            (
-                "2001: A Space Odyssey - The Film Vault Limited Edition (4K Ultra + Blu-ray)",
-                "2001 A Space Odyssey The Film Vault Limited",
-            ),
-            ("(95)The Toxic Avenger 1-4 Collection (Blu-ray)", "(95)The Toxic Avenger 1 4"),
-            (
-                "Avatar: The Way of Water (3D Blu-ray + Blu-ray) (4 disc) (Import)",
-                "Avatar The Way of Water",
-            ),
-            ("Bad boys 1-4 (4 Blu-ray)", "Bad boys 1 4"),
-            # Note: Akame Ga Kill moved to TV test section since it's detected as TV
-            ("Dune: Part One & Two (Blu-ray)", "Dune Part One & Two"),
-        ],
-    )
-    def test_edge_cases(self, tmdb_service, input_title, expected_output):
-        """Test edge cases and complex cleaning scenarios."""
-        result = tmdb_service._clean_title_for_search(input_title, is_tv=False)
-        assert result == expected_output
+        assert tmdb_service._clean_title_for_search(title) == "Memoized Movie Title"
+        assert tmdb_service_module._clean_title_for_search.cache_info().hits == hits + 1
+
+    def test_cleaning_patterns_are_precompiled(self):
+        """Test that title cleaning uses module-level compiled patterns."""
+        patterns = [
+            value
+            for name, value in vars(tmdb_service_module).items()
+            if name.startswith("_") and name.endswith("_RX")
+        ]
+        patterns.extend(tmdb_service_module._TV_SUFFIX_RXS)
+
+        assert patterns
+        assert all(isinstance(pattern, re.Pattern) for pattern in patterns)
 
 
 class TestTVSeriesDetection:
     """Test TV series detection logic."""
 
-    @pytest.fixture
-    def tmdb_service(self):
-        """Create TMDBService instance for testing."""
-        return TMDBService(api_key="test_key", poster_dir="./test_posters")
-
     @pytest.mark.parametrize(
         "title,expected_is_tv",
         [
@@ -230,11 +237,6 @@ class TestTVSeriesDetection:
 class TestYearExtraction:
     """Test year extraction from titles."""
 
-    @pytest.fixture
-    def tmdb_service(self):
-        """Create TMDBService instance for testing."""
-        return TMDBService(api_key="test_key", poster_dir="./test_posters")
-
     @pytest.mark.parametrize(
         "title,expected_year",
         [
@@ -263,11 +265,6 @@ class TestYearExtraction:
 class TestTMDBYearPriority:
     """Test production year prioritization logic used in cdon_scraper."""
 
-    @pytest.fixture
-    def tmdb_service(self):
-        """Create TMDBService instance for testing."""
-        return TMDBService(api_key="test_key", poster_dir="./test_posters")
-
     def test_production_year_priority_logic(self, tmdb_service):
         """Test the year prioritization logic: production_year takes precedence over title extraction."""
 